@@ -11,7 +11,7 @@ __author__ = "Hotspotchi Contributors"
 from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS, Character, SpecialSSID
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode
 from hotspotchi.mac import create_mac_address, format_mac
-from hotspotchi.selection import select_character
+from hotspotchi.selection import select_character, select_characters
 from hotspotchi.ssid import resolve_ssid
 
 __all__ = [
@@ -30,5 +30,6 @@ __all__ = [
     "create_mac_address",
     "format_mac",
     "select_character",
+    "select_characters",
     "resolve_ssid",
 ]
@@ -7,13 +7,14 @@ for Tamagotchi Uni's Tama Search feature.
 Characters are loaded from data/characters.yaml for easy customization.
 """
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Character:
     """A MAC-based Tamagotchi character.
 
@@ -35,7 +36,7 @@ class Character:
             raise ValueError(f"Byte values must be 0-255, got {self.byte1}, {self.byte2}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecialSSID:
     """A special SSID-based event character.
 
@@ -67,6 +68,8 @@ def _parse_byte(value: int | str) -> int:
 def _load_characters_from_yaml() -> tuple[tuple[Character, ...], tuple[SpecialSSID, ...]]:
     """Load characters from the YAML data file.
 
+    Names and SSID strings are interned, since they are used as lookup keys.
+
     Returns:
         Tuple of (characters, special_ssids)
     """
@@ -87,7 +90,7 @@ def _load_characters_from_yaml() -> tuple[tuple[Character, ...], tuple[SpecialSS
             Character(
                 byte1=_parse_byte(char_data["byte1"]),
                 byte2=_parse_byte(char_data["byte2"]),
-                name=char_data["name"],
+                name=sys.intern(char_data["name"]),
                 season=char_data.get("season"),
             )
         )
@@ -97,8 +100,8 @@ def _load_characters_from_yaml() -> tuple[tuple[Character, ...], tuple[SpecialSS
     for ssid_data in data.get("special_ssids", []):
         special_ssids.append(
             SpecialSSID(
-                ssid=ssid_data["ssid"],
-                character_name=ssid_data["character_name"],
+                ssid=sys.intern(ssid_data["ssid"]),
+                character_name=sys.intern(ssid_data["character_name"]),
                 notes=ssid_data["notes"],
                 active=ssid_data.get("active", True),
             )
@@ -107,9 +110,29 @@ def _load_characters_from_yaml() -> tuple[tuple[Character, ...], tuple[SpecialSS
     return (tuple(characters), tuple(special_ssids))
 
 
-# Load characters at module import time
+# Load characters at module import time (tuples, so callers cannot mutate them)
+CHARACTERS: tuple[Character, ...]
+SPECIAL_SSIDS: tuple[SpecialSSID, ...]
 CHARACTERS, SPECIAL_SSIDS = _load_characters_from_yaml()
 
+# (index, SpecialSSID) pairs for the special SSIDs that still work (active is fixed once loaded)
+ACTIVE_INDEXED_SSIDS: tuple[tuple[int, SpecialSSID], ...] = tuple(
+    (i, ssid) for i, ssid in enumerate(SPECIAL_SSIDS) if ssid.active
+)
+
+# Indices of every special SSID, and of the active ones
+ALL_SSID_INDICES: frozenset[int] = frozenset(range(len(SPECIAL_SSIDS)))
+ACTIVE_SSID_INDICES: frozenset[int] = frozenset(i for i, _ in ACTIVE_INDEXED_SSIDS)
+
+# Number of special SSIDs that no longer work
+INACTIVE_SSID_COUNT: int = len(SPECIAL_SSIDS) - len(ACTIVE_SSID_INDICES)
+
+# Characters grouped by season in CHARACTERS order; None holds the year-round characters
+CHARACTERS_BY_SEASON: dict[str | None, tuple[Character, ...]] = {
+    season: tuple(char for char in CHARACTERS if char.season == season)
+    for season in (None, "spring", "summer", "fall", "winter")
+}
+
 
 def get_character_by_name(name: str) -> Character | None:
     """Find a character by name (case-insensitive).
@@ -152,7 +175,7 @@ def get_seasonal_characters(season: str) -> list[Character]:
     Returns:
         List of characters available in that season
     """
-    return [char for char in CHARACTERS if char.season == season.lower()]
+    return list(CHARACTERS_BY_SEASON.get(season.lower(), ()))
 
 
 def get_active_special_ssids() -> list[SpecialSSID]:
@@ -161,4 +184,4 @@ def get_active_special_ssids() -> list[SpecialSSID]:
     Returns:
         List of special SSIDs that are still functional
     """
-    return [ssid for ssid in SPECIAL_SSIDS if ssid.active]
+    return [ssid for _, ssid in ACTIVE_INDEXED_SSIDS]
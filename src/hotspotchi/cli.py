@@ -10,7 +10,7 @@ from pathlib import Path
 import click
 
 from hotspotchi import __version__
-from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS
+from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS, get_seasonal_characters
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode, load_config
 from hotspotchi.hotspot import HotspotManager, run_hotspot
 from hotspotchi.mac import create_mac_address, format_mac
@@ -196,7 +196,7 @@ def list_characters(season: str | None, search: str | None) -> None:
     chars = list(CHARACTERS)
 
     if season:
-        chars = [c for c in chars if c.season == season.lower()]
+        chars = get_seasonal_characters(season)
 
     if search:
         search_lower = search.lower()
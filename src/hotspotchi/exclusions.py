@@ -11,6 +11,7 @@ characters (indices 0-20 stored separately).
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 # Default exclusions file location
@@ -139,6 +140,16 @@ class ExclusionManager:
         self._excluded = set(indices)
         self._save()
 
+    def _snapshot(self) -> tuple[frozenset[int], frozenset[int]]:
+        """Capture character and SSID exclusions without touching the file."""
+        return frozenset(self._excluded), frozenset(self._excluded_ssids)
+
+    def _restore(self, snapshot: tuple[frozenset[int], frozenset[int]]) -> None:
+        """Restore exclusions captured by _snapshot() without saving."""
+        excluded, excluded_ssids = snapshot
+        self._excluded = set(excluded)
+        self._excluded_ssids = set(excluded_ssids)
+
     # Special SSID exclusion methods
 
     def is_ssid_excluded(self, index: int) -> bool:
@@ -161,6 +172,15 @@ class ExclusionManager:
         self._excluded_ssids.add(index)
         self._save()
 
+    def exclude_ssids(self, indices: Iterable[int]) -> None:
+        """Exclude several special SSIDs, saving once.
+
+        Args:
+            indices: Special SSID indices to exclude
+        """
+        self._excluded_ssids.update(indices)
+        self._save()
+
     def include_ssid(self, index: int) -> None:
         """Include a previously excluded special SSID.
 
@@ -221,19 +241,20 @@ _exclusion_manager: ExclusionManager | None = None
 
 
 def get_exclusion_manager(
-    exclusions_file: Path = DEFAULT_EXCLUSIONS_FILE,
+    exclusions_file: Path | None = None,
 ) -> ExclusionManager:
     """Get the global exclusion manager instance.
 
     Args:
-        exclusions_file: Path to exclusions file (only used on first call)
+        exclusions_file: Path to exclusions file (only used on first call;
+            defaults to DEFAULT_EXCLUSIONS_FILE, read at that time)
 
     Returns:
         ExclusionManager instance
     """
     global _exclusion_manager
     if _exclusion_manager is None:
-        _exclusion_manager = ExclusionManager(exclusions_file)
+        _exclusion_manager = ExclusionManager(exclusions_file or DEFAULT_EXCLUSIONS_FILE)
     return _exclusion_manager
 
 
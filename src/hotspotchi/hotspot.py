@@ -20,7 +20,7 @@ from hotspotchi.mac import create_mac_address, format_mac
 from hotspotchi.selection import generate_daily_password, get_day_number, select_combined
 
 
-@dataclass
+@dataclass(slots=True)
 class HotspotState:
     """Current state of the hotspot."""
 
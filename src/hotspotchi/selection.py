@@ -15,15 +15,32 @@ Seasonal characters are automatically filtered based on the current date,
 so only characters available in the current season are selected.
 """
 
+import contextlib
 import random
+import string
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import cycle, islice
 from pathlib import Path
-
-from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS, Character, SpecialSSID
+from typing import Protocol
+
+from hotspotchi.characters import (
+    ACTIVE_INDEXED_SSIDS,
+    CHARACTERS,
+    SPECIAL_SSIDS,
+    Character,
+    SpecialSSID,
+)
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode
 from hotspotchi.exclusions import get_exclusion_manager
 
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# WPA2-safe characters (alphanumeric)
+PASSWORD_CHARS = string.ascii_letters + string.digits
+
 
 def get_current_season(date: datetime | None = None) -> str:
     """Determine the current season based on date.
@@ -43,7 +60,12 @@ def get_current_season(date: datetime | None = None) -> str:
     if date is None:
         date = datetime.now()
 
-    month = date.month
+    return _season_for_month(date.month)
+
+
+@lru_cache(maxsize=12)
+def _season_for_month(month: int) -> str:
+    """Map a month number (1-12) to its season name."""
     if month in (3, 4, 5):
         return "spring"
     elif month in (6, 7, 8):
@@ -75,7 +97,7 @@ def is_character_available_now(character: Character, date: datetime | None = Non
     return character.season == current_season
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectionResult:
     """Result of character selection.
 
@@ -113,8 +135,10 @@ def get_day_number(date: datetime | None = None) -> int:
     This provides a deterministic seed for daily random selection,
     ensuring the same character appears all day but changes at midnight.
 
-    The formula (year * 366 + month * 31 + day) guarantees unique
-    values for each day while being simple to compute.
+    The formula (year * 366 + month * 31 + day) gives distinct values for
+    every day of a year and for consecutive days, and is cheap to compute.
+    It is not a day count (values can drop at New Year), and it must not
+    change: every daily pick and password is seeded from it.
 
     Args:
         date: Date to calculate for (defaults to now)
@@ -149,8 +173,17 @@ def get_available_characters(
         Tuple of available characters
     """
     exclusion_manager = get_exclusion_manager()
-    available = []
 
+    if filter_by_season and characters is CHARACTERS:
+        # The in-season part of the built-in roster only changes with the season
+        available = [
+            CHARACTERS[i]
+            for i in _available_by_season(get_current_season(current_date))
+            if not (respect_exclusions and exclusion_manager.is_excluded(i))
+        ]
+        return tuple(available) if available else characters
+
+    available = []
     for i, char in enumerate(characters):
         # Check exclusion
         if respect_exclusions and exclusion_manager.is_excluded(i):
@@ -165,37 +198,107 @@ def get_available_characters(
     return tuple(available) if available else characters  # Fallback to all if all excluded
 
 
-def get_cycle_index(cycle_file: Path, total_characters: int) -> int:
+@lru_cache(maxsize=4)
+def _available_by_season(season: str) -> tuple[int, ...]:
+    """Indices of CHARACTERS available in a season, in roster order."""
+    return tuple(i for i, char in enumerate(CHARACTERS) if char.season in (None, season))
+
+
+class CycleStorage(Protocol):
+    """Where the cycle index is persisted between selections."""
+
+    def load(self) -> str:
+        """Return the stored index text (raises FileNotFoundError if none)."""
+        ...
+
+    def save(self, value: str) -> None:
+        """Store the index text."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class FileCycleStorage:
+    """Cycle index stored in a text file."""
+
+    path: Path
+
+    def load(self) -> str:
+        """Read the stored index text."""
+        return self.path.read_text()
+
+    def save(self, value: str) -> None:
+        """Write the index text, creating parent directories as needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(value)
+
+
+def _as_cycle_storage(cycle_file: CycleStorage | Path) -> CycleStorage:
+    """Wrap a plain path in FileCycleStorage."""
+    return FileCycleStorage(cycle_file) if isinstance(cycle_file, Path) else cycle_file
+
+
+def _load_cycle_index(storage: CycleStorage) -> int:
+    """Read the stored cycle index, defaulting to 0 if missing or corrupted."""
+    try:
+        return int(storage.load().strip())
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def get_cycle_index(cycle_file: CycleStorage | Path, total_characters: int) -> int:
     """Get the current cycle index and increment it for next time.
 
     The cycle index is persisted to disk so it survives reboots
     and continues from where it left off.
 
     Args:
-        cycle_file: Path to file storing the current index
+        cycle_file: Path to file storing the current index, or another CycleStorage
         total_characters: Total number of characters to cycle through
 
     Returns:
         Current cycle index (0-based)
     """
-    # Read current index
-    try:
-        index = int(cycle_file.read_text().strip())
-    except (FileNotFoundError, ValueError):
-        index = 0
+    return get_cycle_indices(cycle_file, total_characters, 1)[0]
+
+
+def get_cycle_indices(
+    cycle_file: CycleStorage | Path, total_characters: int, count: int
+) -> list[int]:
+    """Get the next count cycle indices and advance past them.
+
+    Equivalent to calling get_cycle_index() count times, but the stored
+    index is read and written only once.
 
-    # Ensure index is valid
-    index = index % total_characters
+    Args:
+        cycle_file: Path to file storing the current index, or another CycleStorage
+        total_characters: Total number of characters to cycle through
+        count: Number of indices to take
+
+    Returns:
+        Successive cycle indices (0-based), wrapping around
+    """
+    storage = _as_cycle_storage(cycle_file)
+    start = _load_cycle_index(storage)
+    indices = [(start + i) % total_characters for i in range(count)]
 
     # Save next index for next time
-    next_index = (index + 1) % total_characters
-    try:
-        cycle_file.parent.mkdir(parents=True, exist_ok=True)
-        cycle_file.write_text(str(next_index))
-    except OSError:
-        pass  # Best effort - continue even if we can't persist
+    with contextlib.suppress(OSError):  # Best effort - continue even if we can't persist
+        storage.save(str((start + count) % total_characters))
+
+    return indices
+
+
+def peek_cycle_index(cycle_file: CycleStorage | Path, total_characters: int) -> int:
+    """Get the current cycle index without advancing it.
+
+    Args:
+        cycle_file: Path to file storing the current index, or another CycleStorage
+        total_characters: Total number of characters to cycle through
 
-    return index
+    Returns:
+        Index the next get_cycle_index() call would return (0-based)
+    """
+    return _load_cycle_index(_as_cycle_storage(cycle_file)) % total_characters
 
 
 def select_character(
@@ -225,8 +328,11 @@ def select_character(
     # Fixed mode ignores exclusions - user explicitly chose this character
     if config.mac_mode == MacMode.FIXED:
         # Clamp index to valid range
-        index = min(config.fixed_character_index, len(characters) - 1)
-        index = max(0, index)
+        index = config.fixed_character_index
+        if index > len(characters) - 1:
+            index = len(characters) - 1
+        if index < 0:
+            index = 0
         return characters[index]
 
     # For rotation modes, filter out excluded characters and out-of-season characters
@@ -249,6 +355,46 @@ def select_character(
     return None
 
 
+def select_characters(
+    config: HotspotchiConfig,
+    n: int,
+    characters: tuple[Character, ...] = CHARACTERS,
+    current_date: datetime | None = None,
+    respect_exclusions: bool = True,
+) -> list[Character]:
+    """Select several characters at once based on the configured MAC mode.
+
+    Equivalent to calling select_character() n times, but the available pool
+    is filtered only once: random mode draws all picks in one call and cycle
+    mode reads and writes the stored index once.
+
+    Args:
+        config: Configuration with mac_mode and related settings
+        n: Number of characters to select
+        characters: Tuple of available characters (defaults to all)
+        current_date: Override current date (for testing)
+        respect_exclusions: If True, excluded characters won't be selected
+
+    Returns:
+        List of n selected characters, or an empty list if mode is DISABLED
+    """
+    if n <= 0 or not characters or config.mac_mode == MacMode.DISABLED:
+        return []
+
+    if config.mac_mode == MacMode.RANDOM:
+        available = get_available_characters(characters, respect_exclusions, True, current_date)
+        return random.choices(available, k=n)
+
+    # Cycle mode advances the persistent index once for the whole batch
+    if config.mac_mode == MacMode.CYCLE:
+        available = get_available_characters(characters, respect_exclusions, True, current_date)
+        return [available[i] for i in get_cycle_indices(config.cycle_file, len(available), n)]
+
+    # Fixed and daily_random give the same character on every call for a given date
+    char = select_character(config, characters, current_date, respect_exclusions)
+    return [char] * n if char is not None else []
+
+
 def get_active_special_ssids(respect_exclusions: bool = True) -> list[tuple[int, SpecialSSID]]:
     """Get all active special SSIDs with their indices.
 
@@ -258,15 +404,12 @@ def get_active_special_ssids(respect_exclusions: bool = True) -> list[tuple[int,
     Returns:
         List of (index, SpecialSSID) tuples
     """
+    if not respect_exclusions:
+        return list(ACTIVE_INDEXED_SSIDS)
     exclusion_manager = get_exclusion_manager()
-    result = []
-    for i, ssid in enumerate(SPECIAL_SSIDS):
-        if not ssid.active:
-            continue
-        if respect_exclusions and exclusion_manager.is_ssid_excluded(i):
-            continue
-        result.append((i, ssid))
-    return result
+    return [
+        (i, ssid) for i, ssid in ACTIVE_INDEXED_SSIDS if not exclusion_manager.is_ssid_excluded(i)
+    ]
 
 
 def select_combined(
@@ -293,8 +436,11 @@ def select_combined(
 
     # Special SSID mode - user explicitly selected a special SSID
     if config.ssid_mode == SsidMode.SPECIAL and SPECIAL_SSIDS:
-        index = min(config.special_ssid_index, len(SPECIAL_SSIDS) - 1)
-        index = max(0, index)
+        index = config.special_ssid_index
+        if index > len(SPECIAL_SSIDS) - 1:
+            index = len(SPECIAL_SSIDS) - 1
+        if index < 0:
+            index = 0
         special = SPECIAL_SSIDS[index]
         return SelectionResult(special_ssid=special)
 
@@ -358,13 +504,7 @@ def get_next_character(
     if config.mac_mode != MacMode.CYCLE:
         return None
 
-    try:
-        current_index = int(config.cycle_file.read_text().strip())
-    except (FileNotFoundError, ValueError):
-        current_index = 0
-
-    current_index = current_index % len(characters)
-    return characters[current_index]
+    return characters[peek_cycle_index(config.cycle_file, len(characters))]
 
 
 def get_upcoming_characters(
@@ -385,17 +525,9 @@ def get_upcoming_characters(
     if config.mac_mode != MacMode.CYCLE:
         return []
 
-    try:
-        current_index = int(config.cycle_file.read_text().strip())
-    except (FileNotFoundError, ValueError):
-        current_index = 0
-
-    upcoming = []
-    for i in range(count):
-        idx = (current_index + i) % len(characters)
-        upcoming.append(characters[idx])
-
-    return upcoming
+    start = peek_cycle_index(config.cycle_file, len(characters))
+    # A negative count gives an empty list rather than an invalid islice stop
+    return list(islice(cycle(characters), start, start + max(count, 0)))
 
 
 def get_seconds_until_midnight() -> int:
@@ -406,14 +538,10 @@ def get_seconds_until_midnight() -> int:
     Returns:
         Number of seconds until next day starts
     """
-    now = datetime.now()
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    # Add one day to get next midnight
-    from datetime import timedelta
-
-    next_midnight = midnight + timedelta(days=1)
-    delta = next_midnight - now
-    return int(delta.total_seconds())
+    now = time.time()
+    # Shift to local wall-clock time, then measure what's left of the day
+    local = now + time.localtime(now).tm_gmtoff
+    return int(SECONDS_PER_DAY - local % SECONDS_PER_DAY)
 
 
 def generate_daily_password(current_date: datetime | None = None) -> str:
@@ -430,14 +558,12 @@ def generate_daily_password(current_date: datetime | None = None) -> str:
     Returns:
         16-character random password
     """
-    import string
+    return _password_for_day(get_day_number(current_date))
 
-    day = get_day_number(current_date)
-    # Use a different seed offset to avoid correlation with character selection
-    random.seed(day + 0x7A6DA0)  # "TAMA" signature offset
 
-    # WPA2-safe characters (alphanumeric)
-    chars = string.ascii_letters + string.digits
-    password = "".join(random.choice(chars) for _ in range(16))
-
-    return password
+@lru_cache(maxsize=366)
+def _password_for_day(day: int) -> str:
+    """Derive the daily password for a day number, cached per day."""
+    # Use a different seed offset to avoid correlation with character selection
+    rng = random.Random(day + 0x7A6DA0)  # "TAMA" signature offset
+    return "".join(rng.choice(PASSWORD_CHARS) for _ in range(16))
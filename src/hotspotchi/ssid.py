@@ -5,10 +5,84 @@ Handles selection of WiFi network names (SSIDs) based on configuration,
 including special event SSIDs that trigger exclusive characters.
 """
 
-from hotspotchi.characters import SPECIAL_SSIDS, SpecialSSID
+import re
+from collections.abc import Callable
+
+from hotspotchi.characters import ACTIVE_INDEXED_SSIDS, SPECIAL_SSIDS, SpecialSSID
 from hotspotchi.config import HotspotchiConfig, SsidMode
 
 
+def _build_lookups() -> tuple[
+    dict[str, int], dict[str, SpecialSSID], dict[str, int], dict[str, SpecialSSID]
+]:
+    """Index SPECIAL_SSIDS by character name and SSID string in a single pass.
+
+    Character names are lowercased. When a name or SSID repeats, the first
+    entry wins, matching a first-match scan of SPECIAL_SSIDS.
+
+    Returns:
+        Tuple of (name -> index, name -> SSID, SSID string -> index, SSID string -> SSID)
+    """
+    char_to_index: dict[str, int] = {}
+    char_to_ssid: dict[str, SpecialSSID] = {}
+    ssid_to_index: dict[str, int] = {}
+    ssid_to_obj: dict[str, SpecialSSID] = {}
+    for i, special in enumerate(SPECIAL_SSIDS):
+        name = special.character_name.lower()
+        if name not in char_to_index:
+            char_to_index[name] = i
+            char_to_ssid[name] = special
+        if special.ssid not in ssid_to_index:
+            ssid_to_index[special.ssid] = i
+            ssid_to_obj[special.ssid] = special
+    return char_to_index, char_to_ssid, ssid_to_index, ssid_to_obj
+
+
+_CHAR_TO_INDEX, _CHAR_TO_SSID, _SSID_TO_INDEX, _SSID_TO_OBJ = _build_lookups()
+
+# Any character outside printable ASCII (space through tilde)
+_NON_PRINTABLE = re.compile(r"[^\x20-\x7e]")
+
+# Highest valid index into SPECIAL_SSIDS
+_MAX_SPECIAL_INDEX = len(SPECIAL_SSIDS) - 1
+
+# Every (index, SpecialSSID) pair, for list_special_ssids(active_only=False)
+_INDEXED_SSIDS: tuple[tuple[int, SpecialSSID], ...] = tuple(enumerate(SPECIAL_SSIDS))
+
+
+def _resolve_normal(config: HotspotchiConfig) -> tuple[str, str | None]:
+    """Use the default SSID."""
+    return config.default_ssid, None
+
+
+def _resolve_custom(config: HotspotchiConfig) -> tuple[str, str | None]:
+    """Use the custom SSID, falling back to the default if none is set."""
+    if config.custom_ssid:
+        return config.custom_ssid, None
+    return _resolve_normal(config)
+
+
+def _resolve_special(config: HotspotchiConfig) -> tuple[str, str | None]:
+    """Use the configured special SSID, clamping the index to the valid range."""
+    if not SPECIAL_SSIDS:
+        return _resolve_normal(config)
+    index = config.special_ssid_index
+    if index > _MAX_SPECIAL_INDEX:
+        index = _MAX_SPECIAL_INDEX
+    if index < 0:
+        index = 0
+    special = SPECIAL_SSIDS[index]
+    return special.ssid, special.character_name
+
+
+# SSID resolver for each mode
+_RESOLVERS: dict[SsidMode, Callable[[HotspotchiConfig], tuple[str, str | None]]] = {
+    SsidMode.NORMAL: _resolve_normal,
+    SsidMode.CUSTOM: _resolve_custom,
+    SsidMode.SPECIAL: _resolve_special,
+}
+
+
 def resolve_ssid(config: HotspotchiConfig) -> tuple[str, str | None]:
     """Resolve the SSID to use based on configuration.
 
@@ -19,17 +93,7 @@ def resolve_ssid(config: HotspotchiConfig) -> tuple[str, str | None]:
         Tuple of (ssid_name, character_name_or_none)
         character_name is set when using a special SSID
     """
-    if config.ssid_mode == SsidMode.SPECIAL and SPECIAL_SSIDS:
-        index = min(config.special_ssid_index, len(SPECIAL_SSIDS) - 1)
-        index = max(0, index)
-        special = SPECIAL_SSIDS[index]
-        return special.ssid, special.character_name
-
-    if config.ssid_mode == SsidMode.CUSTOM and config.custom_ssid:
-        return config.custom_ssid, None
-
-    # Default to normal mode
-    return config.default_ssid, None
+    return _RESOLVERS.get(config.ssid_mode, _resolve_normal)(config)
 
 
 def find_ssid_by_character(character_name: str) -> SpecialSSID | None:
@@ -41,11 +105,7 @@ def find_ssid_by_character(character_name: str) -> SpecialSSID | None:
     Returns:
         SpecialSSID if found, None otherwise
     """
-    name_lower = character_name.lower()
-    for ssid in SPECIAL_SSIDS:
-        if ssid.character_name.lower() == name_lower:
-            return ssid
-    return None
+    return _CHAR_TO_SSID.get(character_name.lower())
 
 
 def find_ssid_by_ssid_string(ssid_string: str) -> SpecialSSID | None:
@@ -57,10 +117,7 @@ def find_ssid_by_ssid_string(ssid_string: str) -> SpecialSSID | None:
     Returns:
         SpecialSSID if found, None otherwise
     """
-    for ssid in SPECIAL_SSIDS:
-        if ssid.ssid == ssid_string:
-            return ssid
-    return None
+    return _SSID_TO_OBJ.get(ssid_string)
 
 
 def get_ssid_index(ssid_string: str) -> int | None:
@@ -74,10 +131,7 @@ def get_ssid_index(ssid_string: str) -> int | None:
     Returns:
         Index in SPECIAL_SSIDS if found, None otherwise
     """
-    for i, ssid in enumerate(SPECIAL_SSIDS):
-        if ssid.ssid == ssid_string:
-            return i
-    return None
+    return _SSID_TO_INDEX.get(ssid_string)
 
 
 def get_ssid_index_by_character(character_name: str) -> int | None:
@@ -89,11 +143,7 @@ def get_ssid_index_by_character(character_name: str) -> int | None:
     Returns:
         Index in SPECIAL_SSIDS if found, None otherwise
     """
-    name_lower = character_name.lower()
-    for i, ssid in enumerate(SPECIAL_SSIDS):
-        if ssid.character_name.lower() == name_lower:
-            return i
-    return None
+    return _CHAR_TO_INDEX.get(character_name.lower())
 
 
 def is_valid_ssid(ssid: str) -> bool:
@@ -107,12 +157,13 @@ def is_valid_ssid(ssid: str) -> bool:
     Returns:
         True if valid SSID
     """
+    # Length first, so empty or oversized input is rejected without scanning it
     if not ssid or len(ssid) > 32:
         return False
 
     # SSID can contain most printable ASCII characters
     # but some characters may cause issues with certain devices
-    return all(32 <= ord(c) <= 126 for c in ssid)
+    return _NON_PRINTABLE.search(ssid) is None
 
 
 def list_special_ssids(active_only: bool = True) -> list[tuple[int, SpecialSSID]]:
@@ -124,9 +175,4 @@ def list_special_ssids(active_only: bool = True) -> list[tuple[int, SpecialSSID]
     Returns:
         List of (index, SpecialSSID) tuples
     """
-    result = []
-    for i, ssid in enumerate(SPECIAL_SSIDS):
-        if active_only and not ssid.active:
-            continue
-        result.append((i, ssid))
-    return result
+    return list(ACTIVE_INDEXED_SSIDS if active_only else _INDEXED_SSIDS)
@@ -9,7 +9,13 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS
+from hotspotchi.characters import (
+    ACTIVE_SSID_INDICES,
+    ALL_SSID_INDICES,
+    CHARACTERS,
+    INACTIVE_SSID_COUNT,
+    SPECIAL_SSIDS,
+)
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode, load_config
 from hotspotchi.exclusions import get_exclusion_manager
 from hotspotchi.hotspot import HotspotManager
@@ -104,6 +110,17 @@ def _is_root() -> bool:
     return os.geteuid() == 0
 
 
+def _run_cmd(cmd: list[str]) -> str:
+    """Run a diagnostic command and return its output (or the error, as text)."""
+    import subprocess
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or result.stderr.strip()
+    except Exception as e:
+        return f"Error: {e}"
+
+
 class StatusResponse(BaseModel):
     """Current hotspot status."""
 
@@ -155,6 +172,12 @@ class UpcomingCharacter(BaseModel):
     mac_address: str
 
 
+class IndicesRequest(BaseModel):
+    """Bulk request naming several indices."""
+
+    indices: list[int]
+
+
 class ConfigUpdate(BaseModel):
     """Configuration update request."""
 
@@ -287,30 +310,26 @@ async def list_ssids(
     available_only: bool = False,
 ) -> list[SpecialSSIDResponse]:
     """List all special SSID characters."""
-    exclusion_manager = get_exclusion_manager()
-    result = []
-    for i, ssid in enumerate(SPECIAL_SSIDS):
-        is_excluded = exclusion_manager.is_ssid_excluded(i)
+    excluded = get_exclusion_manager().get_excluded_ssids()
 
-        if active_only and not ssid.active:
-            continue
-        if excluded_only and not is_excluded:
-            continue
-        if available_only and is_excluded:
-            continue
+    # Filter on index sets rather than checking each SSID
+    selected = ACTIVE_SSID_INDICES if active_only else ALL_SSID_INDICES
+    if excluded_only:
+        selected = selected & excluded
+    if available_only:
+        selected = selected - excluded
 
-        result.append(
-            SpecialSSIDResponse(
-                index=i,
-                ssid=ssid.ssid,
-                character_name=ssid.character_name,
-                notes=ssid.notes,
-                active=ssid.active,
-                excluded=is_excluded,
-            )
+    return [
+        SpecialSSIDResponse(
+            index=i,
+            ssid=SPECIAL_SSIDS[i].ssid,
+            character_name=SPECIAL_SSIDS[i].character_name,
+            notes=SPECIAL_SSIDS[i].notes,
+            active=SPECIAL_SSIDS[i].active,
+            excluded=i in excluded,
         )
-
-    return result
+        for i in sorted(selected)
+    ]
 
 
 @router.get("/ssids/{index}", response_model=SpecialSSIDResponse)
@@ -671,6 +690,24 @@ async def clear_exclusions() -> dict:
 # ============================================
 
 
+@router.post("/ssids/exclude")
+async def exclude_ssids(request: IndicesRequest) -> dict:
+    """Exclude several special SSIDs from rotation modes in one request."""
+    invalid = [i for i in request.indices if not 0 <= i < len(SPECIAL_SSIDS)]
+    if invalid:
+        raise HTTPException(status_code=404, detail=f"SSID not found: {invalid[0]}")
+
+    exclusion_manager = get_exclusion_manager()
+    exclusion_manager.exclude_ssids(request.indices)
+
+    return {
+        "status": "ok",
+        "action": "excluded",
+        "indices": sorted(set(request.indices)),
+        "excluded_count": exclusion_manager.get_excluded_ssid_count(),
+    }
+
+
 @router.post("/ssids/{index}/exclude")
 async def exclude_ssid(index: int) -> dict:
     """Exclude a special SSID from rotation modes."""
@@ -731,7 +768,7 @@ async def get_ssid_exclusions() -> dict:
     """Get all excluded special SSID indices."""
     exclusion_manager = get_exclusion_manager()
     excluded = exclusion_manager.get_excluded_ssids()
-    active_count = sum(1 for s in SPECIAL_SSIDS if s.active)
+    active_count = len(SPECIAL_SSIDS) - INACTIVE_SSID_COUNT
 
     return {
         "excluded_indices": sorted(excluded),
@@ -766,6 +803,15 @@ async def clear_all_exclusions() -> dict:
     }
 
 
+@router.get("/exclusions/summary")
+async def get_exclusions_summary() -> dict:
+    """Get character and special SSID exclusions in one response."""
+    return {
+        "characters": await get_exclusions(),
+        "ssids": await get_ssid_exclusions(),
+    }
+
+
 # ============================================
 # Debug Endpoint
 # ============================================
@@ -777,21 +823,12 @@ async def get_debug_info() -> dict:
 
     Returns system status, config, processes, and more.
     """
-    import subprocess
     from pathlib import Path
 
     config = _current_config
     exclusion_manager = get_exclusion_manager()
     selection = select_combined(config)
 
-    # Get system process info
-    def run_cmd(cmd: list[str]) -> str:
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            return result.stdout.strip() or result.stderr.strip()
-        except Exception as e:
-            return f"Error: {e}"
-
     # Gather debug info
     debug_info = {
         "config": {
@@ -828,18 +865,18 @@ async def get_debug_info() -> dict:
             "exclusions_file_exists": Path("/var/lib/hotspotchi/exclusions.json").exists(),
         },
         "processes": {
-            "hostapd_running": run_cmd(["pgrep", "-x", "hostapd"]) != "",
-            "hostapd_pids": run_cmd(["pgrep", "-x", "hostapd"]),
-            "dnsmasq_running": run_cmd(["pgrep", "dnsmasq"]) != "",
-            "dnsmasq_pids": run_cmd(["pgrep", "dnsmasq"]),
+            "hostapd_running": _run_cmd(["pgrep", "-x", "hostapd"]) != "",
+            "hostapd_pids": _run_cmd(["pgrep", "-x", "hostapd"]),
+            "dnsmasq_running": _run_cmd(["pgrep", "dnsmasq"]) != "",
+            "dnsmasq_pids": _run_cmd(["pgrep", "dnsmasq"]),
         },
         "network": {
-            "interfaces": run_cmd(["ip", "-br", "link"]),
-            "wifi_interface_info": run_cmd(["ip", "addr", "show", config.wifi_interface]),
+            "interfaces": _run_cmd(["ip", "-br", "link"]),
+            "wifi_interface_info": _run_cmd(["ip", "addr", "show", config.wifi_interface]),
         },
         "services": {
-            "hotspotchi_status": run_cmd(["systemctl", "is-active", "hotspotchi"]),
-            "hotspotchi_web_status": run_cmd(["systemctl", "is-active", "hotspotchi-web"]),
+            "hotspotchi_status": _run_cmd(["systemctl", "is-active", "hotspotchi"]),
+            "hotspotchi_web_status": _run_cmd(["systemctl", "is-active", "hotspotchi-web"]),
         },
     }
 
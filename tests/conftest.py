@@ -1,11 +1,90 @@
 """Pytest configuration and fixtures."""
 
+import hashlib
+import importlib
+from datetime import datetime, timedelta
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode
+from hotspotchi.exclusions import reset_exclusion_manager
+from hotspotchi.selection import generate_daily_password
+
+# Modules imported up front so each (xdist) worker pays the import cost at startup
+_PREWARM_MODULES = (
+    "hotspotchi.characters",
+    "hotspotchi.selection",
+    "hotspotchi.hotspot",
+)
+
+
+def pytest_configure() -> None:
+    """Import the modules under test once, before collection starts."""
+    for module in _PREWARM_MODULES:
+        importlib.import_module(module)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _state_dir(tmp_path_factory: pytest.TempPathFactory):
+    """Keep the global exclusions file in a per-worker temp dir, not /var/lib/hotspotchi."""
+    state_dir = tmp_path_factory.mktemp("state")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("hotspotchi.exclusions.DEFAULT_EXCLUSIONS_FILE", state_dir / "exclusions.json")
+        reset_exclusion_manager()
+        yield state_dir
+        reset_exclusion_manager()
+
+
+@pytest.fixture(scope="session")
+def web_app():
+    """The web app, imported and with its OpenAPI schema built once per worker.
+
+    Response models are left in place: the filtering they apply is part of the
+    API contract the route tests check.
+    """
+    from hotspotchi.web.app import app
+
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def spring_date() -> datetime:
+    """A mid-spring date for seasonal filtering tests."""
+    return datetime(2024, 4, 15)
+
+
+@pytest.fixture(scope="session")
+def summer_date() -> datetime:
+    """A mid-summer date for seasonal filtering tests."""
+    return datetime(2024, 7, 15)
+
+
+@pytest.fixture(scope="session")
+def fall_date() -> datetime:
+    """A mid-fall date for seasonal filtering tests."""
+    return datetime(2024, 10, 15)
+
+
+@pytest.fixture(scope="session")
+def winter_date() -> datetime:
+    """A mid-winter date for seasonal filtering tests."""
+    return datetime(2024, 12, 15)
+
+
+@pytest.fixture(scope="session")
+def todays_password() -> str:
+    """Today's generated WiFi password, computed once per session."""
+    return generate_daily_password()
+
+
+@pytest.fixture(scope="session")
+def precomputed_year_passwords() -> dict[datetime, str]:
+    """Daily passwords for every day of 2024, generated once per session."""
+    start = datetime(2024, 1, 1)
+    days = (start + timedelta(days=i) for i in range(366))
+    return {day: generate_daily_password(day) for day in days}
 
 
 @pytest.fixture
@@ -15,16 +94,55 @@ def default_config() -> HotspotchiConfig:
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path: Path) -> Path:
     """Provide a temporary directory."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _cycle_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One shared directory for every test's cycle index file."""
+    return tmp_path_factory.mktemp("cycles")
 
 
 @pytest.fixture
-def temp_cycle_file(temp_dir: Path) -> Path:
+def cycle_file(_cycle_dir: Path, request: pytest.FixtureRequest):
+    """Provide a path for a cycle index file that does not exist yet.
+
+    The file name is a hash of the test's node id, so it is unique across classes,
+    modules and parametrizations and never contains characters invalid in a path.
+    """
+    digest = hashlib.sha1(request.node.nodeid.encode()).hexdigest()
+    path = _cycle_dir / f"{digest}.txt"
+    path.unlink(missing_ok=True)
+    yield path
+    path.unlink(missing_ok=True)
+
+
+class MemoryCycleStorage:
+    """In-memory CycleStorage for cycle index tests."""
+
+    def __init__(self, value: str | None = None):
+        self.value = value
+
+    def load(self) -> str:
+        if self.value is None:
+            raise FileNotFoundError("no cycle index stored")
+        return self.value
+
+    def save(self, value: str) -> None:
+        self.value = value
+
+
+@pytest.fixture
+def cycle_storage() -> MemoryCycleStorage:
+    """Provide an empty in-memory cycle index store."""
+    return MemoryCycleStorage()
+
+
+@pytest.fixture
+def temp_cycle_file(cycle_file: Path) -> Path:
     """Provide a temporary file for cycle index testing."""
-    cycle_file = temp_dir / "cycle.txt"
     cycle_file.write_text("0")
     return cycle_file
 
@@ -38,6 +156,18 @@ def fixed_config() -> HotspotchiConfig:
     )
 
 
+@pytest.fixture(scope="session")
+def random_config() -> HotspotchiConfig:
+    """Configuration for random mode (shared; do not mutate)."""
+    return HotspotchiConfig(mac_mode=MacMode.RANDOM)
+
+
+@pytest.fixture(scope="session")
+def random_no_special_config() -> HotspotchiConfig:
+    """Configuration for random mode without special SSIDs (shared; do not mutate)."""
+    return HotspotchiConfig(mac_mode=MacMode.RANDOM, include_special_ssids=False)
+
+
 @pytest.fixture
 def daily_random_config() -> HotspotchiConfig:
     """Configuration for daily random mode."""
@@ -1,9 +1,16 @@
 """Tests for character data integrity."""
 
+import sys
+
 import pytest
 
 from hotspotchi.characters import (
+    ACTIVE_INDEXED_SSIDS,
+    ACTIVE_SSID_INDICES,
+    ALL_SSID_INDICES,
     CHARACTERS,
+    CHARACTERS_BY_SEASON,
+    INACTIVE_SSID_COUNT,
     SPECIAL_SSIDS,
     Character,
     SpecialSSID,
@@ -58,6 +65,19 @@ class TestCharacterData:
 class TestSpecialSSIDData:
     """Validate special SSID data integrity."""
 
+    def test_data_is_immutable(self):
+        """Character and SSID collections should be tuples."""
+        assert isinstance(CHARACTERS, tuple)
+        assert isinstance(SPECIAL_SSIDS, tuple)
+
+    def test_lookup_strings_are_interned(self):
+        """SSID strings and names should be the interned copies."""
+        for ssid in SPECIAL_SSIDS:
+            assert sys.intern(ssid.ssid) is ssid.ssid
+            assert sys.intern(ssid.character_name) is ssid.character_name
+        for char in CHARACTERS:
+            assert sys.intern(char.name) is char.name
+
     def test_all_ssids_have_names(self):
         """All special SSIDs should have character names."""
         for ssid in SPECIAL_SSIDS:
@@ -83,6 +103,20 @@ class TestSpecialSSIDData:
         for ssid in SPECIAL_SSIDS:
             assert ssid.notes, f"Empty notes for {ssid.character_name}"
 
+    def test_inactive_ssid_count(self):
+        """INACTIVE_SSID_COUNT should match the SSIDs flagged inactive."""
+        assert [s.active for s in SPECIAL_SSIDS].count(False) == INACTIVE_SSID_COUNT
+
+    def test_active_indexed_ssids(self):
+        """ACTIVE_INDEXED_SSIDS should pair each active SSID with its index, in order."""
+        expected = [(i, s) for i, s in enumerate(SPECIAL_SSIDS) if s.active]
+        assert list(ACTIVE_INDEXED_SSIDS) == expected
+
+    def test_ssid_index_sets(self):
+        """ALL_SSID_INDICES should cover every SSID; ACTIVE_SSID_INDICES only the active ones."""
+        assert sorted(ALL_SSID_INDICES) == list(range(len(SPECIAL_SSIDS)))
+        assert {i for i in ALL_SSID_INDICES if SPECIAL_SSIDS[i].active} == ACTIVE_SSID_INDICES
+
 
 class TestCharacterLookup:
     """Test character lookup functions."""
@@ -127,6 +161,13 @@ class TestCharacterLookup:
             chars = get_seasonal_characters(season)
             assert len(chars) == 4, f"Expected 4 {season} characters"
 
+    def test_characters_by_season_partitions_characters(self):
+        """Season groups should cover every character exactly once, in order."""
+        grouped = [char for chars in CHARACTERS_BY_SEASON.values() for char in chars]
+        assert sorted(grouped, key=CHARACTERS.index) == list(CHARACTERS)
+        for season, chars in CHARACTERS_BY_SEASON.items():
+            assert all(c.season == season for c in chars)
+
     def test_get_active_special_ssids(self):
         """Should filter out inactive SSIDs."""
         active = get_active_special_ssids()
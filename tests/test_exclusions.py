@@ -111,6 +111,14 @@ class TestExclusionManagerSSIDs:
         assert manager.is_ssid_excluded(5)
         assert 5 in manager.get_excluded_ssids()
 
+    def test_exclude_ssids_adds_all(self, temp_dir: Path):
+        """Bulk exclude should add every index and persist them."""
+        exclusions_file = temp_dir / "exclusions.json"
+        manager = ExclusionManager(exclusions_file)
+        manager.exclude_ssids([3, 5])
+        assert manager.get_excluded_ssids() == {3, 5}
+        assert ExclusionManager(exclusions_file).get_excluded_ssids() == {3, 5}
+
     def test_include_ssid_removes_from_set(self, temp_dir: Path):
         """Include SSID should remove index from excluded set."""
         manager = ExclusionManager(temp_dir / "exclusions.json")
@@ -180,6 +188,21 @@ class TestExclusionManagerCombined:
         assert not manager.is_excluded(5)
         assert manager.is_ssid_excluded(5)  # SSID still excluded
 
+    def test_snapshot_restore_skips_file(self, temp_dir: Path):
+        """_restore should bring back a _snapshot without writing the file."""
+        exclusions_file = temp_dir / "exclusions.json"
+        manager = ExclusionManager(exclusions_file)
+        manager.exclude(1)
+        manager.exclude_ssid(2)
+        snapshot = manager._snapshot()
+        manager.clear_all()
+        exclusions_file.unlink()
+
+        manager._restore(snapshot)
+        assert manager.get_excluded() == {1}
+        assert manager.get_excluded_ssids() == {2}
+        assert not exclusions_file.exists()
+
     def test_clear_all_removes_both(self, temp_dir: Path):
         """clear_all should remove both character and SSID exclusions."""
         manager = ExclusionManager(temp_dir / "exclusions.json")
@@ -1,14 +1,114 @@
 """Tests for hotspot module."""
 
+import subprocess
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS
 from hotspotchi.config import HotspotchiConfig
 from hotspotchi.hotspot import HotspotManager
+from hotspotchi.selection import SelectionResult
+
+# Canned select_combined() results shared by the get_state/start tests
+_CHAR_RESULT = SelectionResult(character=CHARACTERS[0], special_ssid=None)
+_SPECIAL_RESULT = SelectionResult(character=None, special_ssid=SPECIAL_SSIDS[0])
+_EMPTY_RESULT = SelectionResult(character=None, special_ssid=None)
+
+# Canned subprocess.run() results; tests needing specific stdout build their own
+OK = SimpleNamespace(returncode=0, stdout="")
+FAIL = SimpleNamespace(returncode=1, stdout="")
+
+
+@dataclass(slots=True)
+class _FakeProc:
+    """Minimal stand-in for a subprocess.Popen handle."""
+
+    poll_rv: int | None = None
+    communicate_rv: tuple[bytes, bytes] = (b"", b"")
+    timeout: bool = False
+    pid: int = 4242
+    terminate: MagicMock = field(default_factory=MagicMock)
+    kill: MagicMock = field(default_factory=MagicMock)
+    wait: MagicMock = field(default_factory=MagicMock)
+
+    def __post_init__(self) -> None:
+        if self.timeout:
+            self.wait.side_effect = subprocess.TimeoutExpired("proc", 5)
+
+    def poll(self) -> int | None:
+        return self.poll_rv
+
+    def communicate(self) -> tuple[bytes, bytes]:
+        return self.communicate_rv
+
+
+@dataclass(slots=True)
+class _FakePath:
+    """Minimal stand-in for pathlib.Path as used by HotspotManager.
+
+    Calling the instance returns itself, so it can replace the Path class.
+    """
+
+    exists_rv: bool = True
+    read_text_rv: str | None = None
+    exc: type[Exception] | None = None
+
+    def __call__(self, *_args, **_kwargs) -> "_FakePath":
+        return self
+
+    def exists(self) -> bool:
+        return self.exists_rv
+
+    def read_text(self) -> str | None:
+        if self.exc:
+            raise self.exc()
+        return self.read_text_rv
+
+    def unlink(self) -> None:
+        pass
+
+
+# Tools reported as installed by the stubbed shutil.which
+_INSTALLED_TOOLS = {
+    tool: f"/usr/sbin/{tool}" for tool in ("hostapd", "dnsmasq", "ip", "rfkill", "iw")
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_system_lookups():
+    """Pretend to run as root with all tools installed; tests override as needed."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("shutil.which", _INSTALLED_TOOLS.get)
+        mp.setattr("os.geteuid", lambda: 0)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Make HotspotManager's settle delays instant; only hotspot's time reference is swapped."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("hotspotchi.hotspot.time", SimpleNamespace(sleep=lambda *_: None))
+        yield
 
 
 @pytest.fixture
+def fake_path(monkeypatch: pytest.MonkeyPatch):
+    """Replace hotspotchi.hotspot.Path with a configurable _FakePath."""
+
+    def _make(**kwargs) -> _FakePath:
+        path = _FakePath(**kwargs)
+        monkeypatch.setattr("hotspotchi.hotspot.Path", path)
+        return path
+
+    return _make
+
+
+@pytest.fixture(scope="module")
 def config():
     """Create a test config."""
     return HotspotchiConfig(
@@ -17,7 +117,7 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def concurrent_config():
     """Create a test config with concurrent mode."""
     return HotspotchiConfig(
@@ -27,6 +127,24 @@ def concurrent_config():
     )
 
 
+@pytest.fixture(scope="class")
+def manager(config: HotspotchiConfig) -> HotspotManager:
+    """Shared manager for tests that never mutate it; mutating tests build their own."""
+    return HotspotManager(config)
+
+
+@pytest.fixture(scope="class")
+def concurrent_manager(concurrent_config: HotspotchiConfig) -> HotspotManager:
+    """Shared concurrent-mode manager for tests that never mutate it."""
+    return HotspotManager(concurrent_config)
+
+
+@pytest.fixture(scope="class")
+def open_manager() -> HotspotManager:
+    """Shared manager for an open (passwordless) network."""
+    return HotspotManager(HotspotchiConfig(wifi_password=""))
+
+
 class TestHotspotManagerInit:
     """Tests for HotspotManager initialization."""
 
@@ -45,54 +163,45 @@ class TestHotspotManagerInit:
 class TestHotspotManagerChecks:
     """Tests for HotspotManager system checks."""
 
-    def test_check_root_as_root(self, config: HotspotchiConfig):
+    def test_check_root_as_root(self, manager: HotspotManager):
         """check_root should return True when running as root."""
-        manager = HotspotManager(config)
-        with patch("os.geteuid", return_value=0):
-            assert manager.check_root() is True
+        assert manager.check_root() is True
 
-    def test_check_root_not_root(self, config: HotspotchiConfig):
+    def test_check_root_not_root(self, manager: HotspotManager):
         """check_root should return False when not root."""
-        manager = HotspotManager(config)
         with patch("os.geteuid", return_value=1000):
             assert manager.check_root() is False
 
-    @patch("shutil.which")
-    def test_check_dependencies_all_present(self, mock_which: MagicMock, config: HotspotchiConfig):
+    def test_check_dependencies_all_present(self, manager: HotspotManager):
         """check_dependencies should return empty list when all present."""
-        mock_which.return_value = "/usr/sbin/hostapd"
-        manager = HotspotManager(config)
         missing = manager.check_dependencies()
         assert missing == []
 
     @patch("shutil.which")
     def test_check_dependencies_missing_hostapd(
-        self, mock_which: MagicMock, config: HotspotchiConfig
+        self, mock_which: MagicMock, manager: HotspotManager
     ):
         """check_dependencies should list missing hostapd."""
         mock_which.side_effect = lambda x: None if x == "hostapd" else f"/usr/bin/{x}"
-        manager = HotspotManager(config)
         missing = manager.check_dependencies()
         assert "hostapd" in missing
 
     @patch("shutil.which")
     def test_check_dependencies_missing_dnsmasq(
-        self, mock_which: MagicMock, config: HotspotchiConfig
+        self, mock_which: MagicMock, manager: HotspotManager
     ):
         """check_dependencies should list missing dnsmasq."""
         mock_which.side_effect = lambda x: None if x == "dnsmasq" else f"/usr/bin/{x}"
-        manager = HotspotManager(config)
         missing = manager.check_dependencies()
         assert "dnsmasq" in missing
 
     @patch("shutil.which")
     def test_check_dependencies_concurrent_mode_needs_iw(
-        self, mock_which: MagicMock, concurrent_config: HotspotchiConfig
+        self, mock_which: MagicMock, concurrent_manager: HotspotManager
     ):
         """check_dependencies in concurrent mode should check for iw."""
         mock_which.side_effect = lambda x: None if x == "iw" else f"/usr/bin/{x}"
-        manager = HotspotManager(concurrent_config)
-        missing = manager.check_dependencies()
+        missing = concurrent_manager.check_dependencies()
         assert "iw" in missing
 
 
@@ -100,93 +209,76 @@ class TestHotspotManagerIsRunning:
     """Tests for is_running check."""
 
     @patch("subprocess.run")
-    def test_is_running_true(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_is_running_true(self, mock_run: MagicMock, manager: HotspotManager):
         """is_running should return True when hostapd is running."""
-        mock_run.return_value = MagicMock(returncode=0)
-        manager = HotspotManager(config)
+        mock_run.return_value = OK
         assert manager.is_running() is True
 
     @patch("subprocess.run")
-    def test_is_running_false(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_is_running_false(self, mock_run: MagicMock, manager: HotspotManager):
         """is_running should return False when hostapd is not running."""
-        mock_run.return_value = MagicMock(returncode=1)
-        manager = HotspotManager(config)
+        mock_run.return_value = FAIL
         assert manager.is_running() is False
 
 
 class TestConcurrentSupport:
     """Tests for concurrent mode support detection."""
 
-    @patch("shutil.which")
-    def test_concurrent_support_no_iw(self, mock_which: MagicMock):
-        """Should fail gracefully when iw is not installed."""
-        mock_which.return_value = None
-        supported, msg = HotspotManager.check_concurrent_support()
-        assert supported is False
-        assert "iw command not found" in msg
-
-    @patch("shutil.which")
-    @patch("hotspotchi.hotspot.Path")
-    def test_concurrent_support_no_interface(self, mock_path: MagicMock, mock_which: MagicMock):
-        """Should fail when interface doesn't exist."""
-        mock_which.return_value = "/usr/bin/iw"
-        mock_path.return_value.exists.return_value = False
-        supported, msg = HotspotManager.check_concurrent_support("wlan0")
-        assert supported is False
-        assert "not found" in msg
-
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("hotspotchi.hotspot.Path")
-    def test_concurrent_support_check_fails(
-        self, mock_path: MagicMock, mock_which: MagicMock, mock_run: MagicMock
-    ):
-        """Should handle failed capability check."""
-        mock_which.return_value = "/usr/bin/iw"
-        mock_path.return_value.exists.return_value = True
-        mock_run.return_value = MagicMock(returncode=1, stdout="")
-        supported, msg = HotspotManager.check_concurrent_support("wlan0")
-        assert supported is False
-        assert "Could not determine" in msg
-
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("hotspotchi.hotspot.Path")
-    def test_concurrent_support_supported(
-        self, mock_path: MagicMock, mock_which: MagicMock, mock_run: MagicMock
+    @pytest.mark.parametrize(
+        ("iw_installed", "exists", "run_result", "expected_supported", "expected_msg"),
+        [
+            pytest.param(False, False, OK, False, "iw command not found", id="no_iw"),
+            pytest.param(True, False, OK, False, "not found", id="no_interface"),
+            pytest.param(True, True, FAIL, False, "Could not determine", id="check_fails"),
+            pytest.param(
+                True,
+                True,
+                SimpleNamespace(returncode=0, stdout="AP, managed, 1 channel"),
+                True,
+                "supports",
+                id="supported",
+            ),
+        ],
+    )
+    def test_concurrent_support(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_path,
+        iw_installed: bool,
+        exists: bool,
+        run_result: SimpleNamespace,
+        expected_supported: bool,
+        expected_msg: str,
     ):
-        """Should detect when AP + station is supported."""
-        mock_which.return_value = "/usr/bin/iw"
-        mock_path.return_value.exists.return_value = True
-        mock_run.return_value = MagicMock(returncode=0, stdout="AP, managed, 1 channel")
+        """Should report support based on iw, the interface and the phy capabilities."""
+        if not iw_installed:
+            monkeypatch.setattr("shutil.which", lambda _: None)
+        fake_path(exists_rv=exists)
+        monkeypatch.setattr("subprocess.run", lambda *_args, **_kwargs: run_result)
         supported, msg = HotspotManager.check_concurrent_support("wlan0")
-        assert supported is True
-        assert "supports" in msg.lower()
+        assert supported is expected_supported
+        assert expected_msg in msg
 
 
 class TestHotspotManagerHelpers:
     """Tests for helper methods."""
 
-    def test_get_effective_interface_normal(self, config: HotspotchiConfig):
+    def test_get_effective_interface_normal(self, manager: HotspotManager):
         """Should return wifi_interface in normal mode."""
-        manager = HotspotManager(config)
         assert manager._get_effective_interface() == "wlan0"
 
-    def test_get_effective_interface_concurrent(self, concurrent_config: HotspotchiConfig):
+    def test_get_effective_interface_concurrent(self, concurrent_manager: HotspotManager):
         """Should return ap_interface in concurrent mode."""
-        manager = HotspotManager(concurrent_config)
-        assert manager._get_effective_interface() == "uap0"
+        assert concurrent_manager._get_effective_interface() == "uap0"
 
-    def test_is_5ghz_channel_true(self, config: HotspotchiConfig):
+    def test_is_5ghz_channel_true(self, manager: HotspotManager):
         """Should return True for 5GHz channels."""
-        manager = HotspotManager(config)
         assert manager._is_5ghz_channel(36) is True
         assert manager._is_5ghz_channel(40) is True
         assert manager._is_5ghz_channel(149) is True
 
-    def test_is_5ghz_channel_false(self, config: HotspotchiConfig):
+    def test_is_5ghz_channel_false(self, manager: HotspotManager):
         """Should return False for 2.4GHz channels."""
-        manager = HotspotManager(config)
         assert manager._is_5ghz_channel(1) is False
         assert manager._is_5ghz_channel(6) is False
         assert manager._is_5ghz_channel(11) is False
@@ -196,54 +288,48 @@ class TestHotspotManagerHelpers:
 class TestHotspotManagerVirtualInterface:
     """Tests for virtual interface management."""
 
-    @patch("hotspotchi.hotspot.Path")
     def test_create_virtual_interface_already_exists(
-        self, mock_path: MagicMock, concurrent_config: HotspotchiConfig
+        self, fake_path, concurrent_config: HotspotchiConfig
     ):
         """Should return True if interface already exists."""
-        mock_path.return_value.exists.return_value = True
+        fake_path(exists_rv=True)
         manager = HotspotManager(concurrent_config)
         result = manager._create_virtual_interface()
         assert result is True
 
-    @patch("hotspotchi.hotspot.time.sleep")
     @patch("subprocess.run")
-    @patch("hotspotchi.hotspot.Path")
     def test_create_virtual_interface_success(
         self,
-        mock_path: MagicMock,
         mock_run: MagicMock,
-        _mock_sleep: MagicMock,
+        fake_path,
         concurrent_config: HotspotchiConfig,
     ):
         """Should create interface if it doesn't exist."""
-        mock_path.return_value.exists.return_value = False
-        mock_run.return_value = MagicMock(returncode=0)
+        fake_path(exists_rv=False)
+        mock_run.return_value = OK
         manager = HotspotManager(concurrent_config)
         result = manager._create_virtual_interface()
         assert result is True
         assert manager._virtual_interface_created is True
 
     @patch("subprocess.run")
-    @patch("hotspotchi.hotspot.Path")
     def test_create_virtual_interface_failure(
-        self, mock_path: MagicMock, mock_run: MagicMock, concurrent_config: HotspotchiConfig
+        self, mock_run: MagicMock, fake_path, concurrent_config: HotspotchiConfig
     ):
         """Should return False on creation failure."""
-        mock_path.return_value.exists.return_value = False
-        mock_run.return_value = MagicMock(returncode=1)
+        fake_path(exists_rv=False)
+        mock_run.return_value = FAIL
         manager = HotspotManager(concurrent_config)
         result = manager._create_virtual_interface()
         assert result is False
 
     @patch("subprocess.run")
-    @patch("hotspotchi.hotspot.Path")
     def test_remove_virtual_interface(
-        self, mock_path: MagicMock, mock_run: MagicMock, concurrent_config: HotspotchiConfig
+        self, mock_run: MagicMock, fake_path, concurrent_config: HotspotchiConfig
     ):
         """Should remove interface if it exists."""
-        mock_path.return_value.exists.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
+        fake_path(exists_rv=True)
+        mock_run.return_value = OK
         manager = HotspotManager(concurrent_config)
         manager._virtual_interface_created = True
         manager._remove_virtual_interface()
@@ -254,34 +340,31 @@ class TestHotspotManagerChannelDetection:
     """Tests for channel detection."""
 
     @patch("subprocess.run")
-    def test_get_current_channel_success(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_get_current_channel_success(self, mock_run: MagicMock, manager: HotspotManager):
         """Should parse channel from iw output."""
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = SimpleNamespace(
             returncode=0,
             stdout="Interface wlan0\nchannel 6 (2437 MHz)\n",
         )
-        manager = HotspotManager(config)
         channel = manager._get_current_channel()
         assert channel == 6
 
     @patch("subprocess.run")
-    def test_get_current_channel_default(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_get_current_channel_default(self, mock_run: MagicMock, manager: HotspotManager):
         """Should return default channel on failure."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="")
-        manager = HotspotManager(config)
+        mock_run.return_value = FAIL
         channel = manager._get_current_channel()
         assert channel == 7  # Default
 
     @patch("subprocess.run")
     def test_get_current_channel_no_channel_info(
-        self, mock_run: MagicMock, config: HotspotchiConfig
+        self, mock_run: MagicMock, manager: HotspotManager
     ):
         """Should return default if no channel in output."""
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = SimpleNamespace(
             returncode=0,
             stdout="Interface wlan0\ntype managed\n",
         )
-        manager = HotspotManager(config)
         channel = manager._get_current_channel()
         assert channel == 7  # Default
 
@@ -289,54 +372,38 @@ class TestHotspotManagerChannelDetection:
 class TestHotspotManagerMACAddress:
     """Tests for MAC address operations."""
 
-    @patch("hotspotchi.hotspot.Path")
-    def test_get_current_mac_success(self, mock_path: MagicMock, config: HotspotchiConfig):
+    def test_get_current_mac_success(self, fake_path, manager: HotspotManager):
         """Should read MAC from sysfs."""
-        mock_path.return_value.read_text.return_value = "aa:bb:cc:dd:ee:ff\n"
-        manager = HotspotManager(config)
+        fake_path(read_text_rv="aa:bb:cc:dd:ee:ff\n")
         mac = manager._get_current_mac("wlan0")
         assert mac == "aa:bb:cc:dd:ee:ff"
 
-    @patch("hotspotchi.hotspot.Path")
-    def test_get_current_mac_not_found(self, mock_path: MagicMock, config: HotspotchiConfig):
+    def test_get_current_mac_not_found(self, fake_path, manager: HotspotManager):
         """Should return None if file not found."""
-        mock_path.return_value.read_text.side_effect = FileNotFoundError()
-        manager = HotspotManager(config)
+        fake_path(exc=FileNotFoundError)
         mac = manager._get_current_mac("wlan0")
         assert mac is None
 
-    @patch("hotspotchi.hotspot.Path")
-    def test_get_current_mac_permission_denied(
-        self, mock_path: MagicMock, config: HotspotchiConfig
-    ):
+    def test_get_current_mac_permission_denied(self, fake_path, manager: HotspotManager):
         """Should return None if permission denied."""
-        mock_path.return_value.read_text.side_effect = PermissionError()
-        manager = HotspotManager(config)
+        fake_path(exc=PermissionError)
         mac = manager._get_current_mac("wlan0")
         assert mac is None
 
-    @patch("hotspotchi.hotspot.time.sleep")
     @patch("subprocess.run")
-    def test_set_mac_address_success(
-        self, mock_run: MagicMock, _mock_sleep: MagicMock, config: HotspotchiConfig
-    ):
+    def test_set_mac_address_success(self, mock_run: MagicMock, manager: HotspotManager):
         """Should set MAC address successfully."""
-        mock_run.return_value = MagicMock(returncode=0)
-        manager = HotspotManager(config)
+        mock_run.return_value = OK
         result = manager._set_mac_address("aa:bb:cc:dd:ee:ff")
         assert result is True
 
-    @patch("hotspotchi.hotspot.time.sleep")
     @patch("subprocess.run")
-    def test_set_mac_address_failure(
-        self, mock_run: MagicMock, _mock_sleep: MagicMock, config: HotspotchiConfig
-    ):
+    def test_set_mac_address_failure(self, mock_run: MagicMock, manager: HotspotManager):
         """Should return False on failure."""
         mock_run.side_effect = [
-            MagicMock(returncode=0),  # ip link down
-            MagicMock(returncode=1),  # ip link set address fails
+            OK,  # ip link down
+            FAIL,  # ip link set address fails
         ]
-        manager = HotspotManager(config)
         result = manager._set_mac_address("aa:bb:cc:dd:ee:ff")
         assert result is False
 
@@ -344,10 +411,9 @@ class TestHotspotManagerMACAddress:
 class TestHotspotManagerPassword:
     """Tests for password handling."""
 
-    def test_get_effective_password_daily(self, config: HotspotchiConfig):
+    def test_get_effective_password_daily(self, manager: HotspotManager):
         """Should generate daily password when None."""
         # Default config has wifi_password=None
-        manager = HotspotManager(config)
         password = manager._get_effective_password()
         assert password is not None
         assert len(password) == 16
@@ -359,11 +425,9 @@ class TestHotspotManagerPassword:
         password = manager._get_effective_password()
         assert password == "mypassword123"
 
-    def test_get_effective_password_open(self):
+    def test_get_effective_password_open(self, open_manager: HotspotManager):
         """Should return None for open network."""
-        config = HotspotchiConfig(wifi_password="")
-        manager = HotspotManager(config)
-        password = manager._get_effective_password()
+        password = open_manager._get_effective_password()
         assert password is None
 
 
@@ -372,11 +436,10 @@ class TestHotspotManagerConfigGeneration:
 
     @patch("subprocess.run")
     def test_create_hostapd_config_with_password(
-        self, mock_run: MagicMock, config: HotspotchiConfig
+        self, mock_run: MagicMock, manager: HotspotManager
     ):
         """Should create hostapd config with WPA2."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="")  # No channel info
-        manager = HotspotManager(config)
+        mock_run.return_value = FAIL  # No channel info
         config_path = manager._create_hostapd_config("TestSSID")
 
         content = config_path.read_text()
@@ -389,12 +452,12 @@ class TestHotspotManagerConfigGeneration:
         config_path.unlink()
 
     @patch("subprocess.run")
-    def test_create_hostapd_config_open_network(self, mock_run: MagicMock):
+    def test_create_hostapd_config_open_network(
+        self, mock_run: MagicMock, open_manager: HotspotManager
+    ):
         """Should create hostapd config without WPA for open network."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="")
-        config = HotspotchiConfig(wifi_password="")
-        manager = HotspotManager(config)
-        config_path = manager._create_hostapd_config("OpenSSID")
+        mock_run.return_value = FAIL
+        config_path = open_manager._create_hostapd_config("OpenSSID")
 
         content = config_path.read_text()
         assert "ssid=OpenSSID" in content
@@ -405,7 +468,7 @@ class TestHotspotManagerConfigGeneration:
     @patch("subprocess.run")
     def test_create_hostapd_config_5ghz(self, mock_run: MagicMock):
         """Should use hw_mode=a for 5GHz channels."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="channel 36 (5180 MHz)")
+        mock_run.return_value = SimpleNamespace(returncode=0, stdout="channel 36 (5180 MHz)")
         config = HotspotchiConfig(concurrent_mode=True)
         manager = HotspotManager(config)
         config_path = manager._create_hostapd_config("5GHz_SSID")
@@ -416,9 +479,8 @@ class TestHotspotManagerConfigGeneration:
 
         config_path.unlink()
 
-    def test_create_dnsmasq_config(self, config: HotspotchiConfig):
+    def test_create_dnsmasq_config(self, config: HotspotchiConfig, manager: HotspotManager):
         """Should create dnsmasq config."""
-        manager = HotspotManager(config)
         config_path = manager._create_dnsmasq_config()
 
         content = config_path.read_text()
@@ -432,29 +494,27 @@ class TestHotspotManagerServiceControl:
     """Tests for service control methods."""
 
     @patch("subprocess.run")
-    def test_stop_conflicting_services(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_stop_conflicting_services(self, mock_run: MagicMock, manager: HotspotManager):
         """Should stop conflicting services."""
-        mock_run.return_value = MagicMock(returncode=0)
-        manager = HotspotManager(config)
+        mock_run.return_value = OK
         manager._stop_conflicting_services()
         # Should have called systemctl stop and killall
         assert mock_run.call_count >= 4
 
     @patch("subprocess.run")
-    def test_unblock_wifi(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_unblock_wifi(self, mock_run: MagicMock, manager: HotspotManager):
         """Should unblock WiFi."""
-        mock_run.return_value = MagicMock(returncode=0)
-        manager = HotspotManager(config)
+        mock_run.return_value = OK
         manager._unblock_wifi()
-        # Should have called rfkill unblock
-        call_args = str(mock_run.call_args)
-        assert "rfkill" in call_args
+        # Commands are shell strings; split to check the argv
+        cmd = mock_run.call_args.args[0].split()
+        assert cmd[0] == "rfkill"
+        assert "unblock" in cmd
 
     @patch("subprocess.run")
-    def test_configure_interface(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_configure_interface(self, mock_run: MagicMock, manager: HotspotManager):
         """Should configure IP address."""
-        mock_run.return_value = MagicMock(returncode=0)
-        manager = HotspotManager(config)
+        mock_run.return_value = OK
         manager._configure_interface()
         # Should have called ip addr flush, ip addr add, ip link set up
         assert mock_run.call_count >= 3
@@ -463,22 +523,18 @@ class TestHotspotManagerServiceControl:
 class TestHotspotManagerStartStop:
     """Tests for start/stop with mocked dependencies."""
 
-    @patch("os.geteuid")
-    def test_start_requires_root(self, mock_geteuid: MagicMock, config: HotspotchiConfig):
+    def test_start_requires_root(self, monkeypatch: pytest.MonkeyPatch, config: HotspotchiConfig):
         """Should raise error if not root."""
-        mock_geteuid.return_value = 1000  # Not root
+        monkeypatch.setattr("os.geteuid", lambda: 1000)  # Not root
         manager = HotspotManager(config)
         with pytest.raises(RuntimeError, match="Must run as root"):
             manager.start()
 
-    @patch("shutil.which")
-    @patch("os.geteuid")
     def test_start_checks_dependencies(
-        self, mock_geteuid: MagicMock, mock_which: MagicMock, config: HotspotchiConfig
+        self, monkeypatch: pytest.MonkeyPatch, config: HotspotchiConfig
     ):
         """Should raise error if dependencies missing."""
-        mock_geteuid.return_value = 0  # Root
-        mock_which.return_value = None  # All deps missing
+        monkeypatch.setattr("shutil.which", lambda _tool: None)  # All deps missing
         manager = HotspotManager(config)
         with pytest.raises(RuntimeError, match="Missing dependencies"):
             manager.start()
@@ -486,14 +542,10 @@ class TestHotspotManagerStartStop:
     @patch("subprocess.run")
     def test_stop_cleans_up(self, mock_run: MagicMock, config: HotspotchiConfig):
         """Should clean up processes and files."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
-        manager._hostapd_process = MagicMock()
-        manager._hostapd_process.terminate = MagicMock()
-        manager._hostapd_process.wait = MagicMock()
-        manager._dnsmasq_process = MagicMock()
-        manager._dnsmasq_process.terminate = MagicMock()
-        manager._dnsmasq_process.wait = MagicMock()
+        manager._hostapd_process = _FakeProc()
+        manager._dnsmasq_process = _FakeProc()
 
         # Capture references before stop() sets them to None
         hostapd_mock = manager._hostapd_process
@@ -507,22 +559,20 @@ class TestHotspotManagerStartStop:
     @patch("subprocess.run")
     def test_stop_restores_mac(self, mock_run: MagicMock, config: HotspotchiConfig):
         """Should restore original MAC address."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
         manager._original_mac = "aa:bb:cc:dd:ee:ff"
 
         manager.stop()
 
         # Should have called ip link to restore MAC
-        calls_str = str(mock_run.call_args_list)
-        assert "aa:bb:cc:dd:ee:ff" in calls_str
+        assert any("aa:bb:cc:dd:ee:ff" in call.args[0] for call in mock_run.call_args_list)
 
     @patch("subprocess.run")
-    @patch("hotspotchi.hotspot.Path")
-    def test_stop_concurrent_removes_interface(self, mock_path: MagicMock, mock_run: MagicMock):
+    def test_stop_concurrent_removes_interface(self, mock_run: MagicMock, fake_path):
         """Should remove virtual interface in concurrent mode."""
-        mock_run.return_value = MagicMock(returncode=0)
-        mock_path.return_value.exists.return_value = True
+        mock_run.return_value = OK
+        fake_path(exists_rv=True)
 
         config = HotspotchiConfig(concurrent_mode=True, ap_interface="uap0")
         manager = HotspotManager(config)
@@ -531,20 +581,16 @@ class TestHotspotManagerStartStop:
         manager.stop()
 
         # Should have called iw dev del
-        calls_str = str(mock_run.call_args_list)
-        assert "uap0" in calls_str
+        assert any("uap0" in call.args[0] for call in mock_run.call_args_list)
 
     @patch("subprocess.run")
     def test_stop_handles_hostapd_timeout(self, mock_run: MagicMock, config: HotspotchiConfig):
         """Should kill process if terminate times out."""
-        import subprocess
-
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
 
-        # Create mock process that times out on wait
-        mock_process = MagicMock()
-        mock_process.wait.side_effect = subprocess.TimeoutExpired("hostapd", 5)
+        # Create fake process that times out on wait
+        mock_process = _FakeProc(timeout=True)
         manager._hostapd_process = mock_process
 
         manager.stop()
@@ -555,14 +601,11 @@ class TestHotspotManagerStartStop:
     @patch("subprocess.run")
     def test_stop_handles_dnsmasq_timeout(self, mock_run: MagicMock, config: HotspotchiConfig):
         """Should kill dnsmasq if terminate times out."""
-        import subprocess
-
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
 
-        # Create mock process that times out on wait
-        mock_process = MagicMock()
-        mock_process.wait.side_effect = subprocess.TimeoutExpired("dnsmasq", 5)
+        # Create fake process that times out on wait
+        mock_process = _FakeProc(timeout=True)
         manager._dnsmasq_process = mock_process
 
         manager.stop()
@@ -571,19 +614,18 @@ class TestHotspotManagerStartStop:
         mock_process.kill.assert_called_once()
 
     @patch("subprocess.run")
-    def test_stop_cleans_config_files(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_stop_cleans_config_files(
+        self, mock_run: MagicMock, config: HotspotchiConfig, temp_dir: Path
+    ):
         """Should remove config files if they exist."""
-        import tempfile
-        from pathlib import Path
-
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
 
         # Create temp files to represent configs
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".conf") as f:
-            hostapd_path = Path(f.name)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".conf") as f:
-            dnsmasq_path = Path(f.name)
+        hostapd_path = temp_dir / "hostapd.conf"
+        dnsmasq_path = temp_dir / "dnsmasq.conf"
+        hostapd_path.touch()
+        dnsmasq_path.touch()
 
         manager._hostapd_config = hostapd_path
         manager._dnsmasq_config = dnsmasq_path
@@ -598,53 +640,57 @@ class TestHotspotManagerRestart:
     """Tests for restart method."""
 
     @patch("subprocess.run")
-    def test_restart_stops_and_starts(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_restart_stops_and_starts(
+        self, mock_run: MagicMock, monkeypatch: pytest.MonkeyPatch, config: HotspotchiConfig
+    ):
         """Should stop and start when running."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
+        mock_stop = MagicMock()
+        mock_start = MagicMock(return_value=MagicMock())
 
-        # Mock is_running to return True first, then False after stop
-        with (
-            patch.object(manager, "is_running", side_effect=[True, False]),
-            patch.object(manager, "stop") as mock_stop,
-            patch.object(manager, "start") as mock_start,
-        ):
-            mock_start.return_value = MagicMock()
-            manager.restart()
-            mock_stop.assert_called_once()
-            mock_start.assert_called_once()
+        # is_running reports True first, then False after stop
+        monkeypatch.setattr(manager, "is_running", MagicMock(side_effect=[True, False]))
+        monkeypatch.setattr(manager, "stop", mock_stop)
+        monkeypatch.setattr(manager, "start", mock_start)
+
+        manager.restart()
+        mock_stop.assert_called_once()
+        mock_start.assert_called_once()
 
     @patch("subprocess.run")
-    def test_restart_with_new_config(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_restart_with_new_config(
+        self, mock_run: MagicMock, monkeypatch: pytest.MonkeyPatch, config: HotspotchiConfig
+    ):
         """Should update config on restart."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
+        mock_start = MagicMock(return_value=MagicMock())
 
         new_config = HotspotchiConfig(wifi_interface="wlan1")
 
-        with (
-            patch.object(manager, "is_running", return_value=False),
-            patch.object(manager, "start") as mock_start,
-        ):
-            mock_start.return_value = MagicMock()
-            manager.restart(new_config)
-            assert manager.config == new_config
-            mock_start.assert_called_once()
+        monkeypatch.setattr(manager, "is_running", lambda: False)
+        monkeypatch.setattr(manager, "start", mock_start)
+
+        manager.restart(new_config)
+        assert manager.config == new_config
+        mock_start.assert_called_once()
 
     @patch("subprocess.run")
-    def test_restart_not_running_no_new_config(self, mock_run: MagicMock, config: HotspotchiConfig):
+    def test_restart_not_running_no_new_config(
+        self, mock_run: MagicMock, monkeypatch: pytest.MonkeyPatch, config: HotspotchiConfig
+    ):
         """Should return current state if not running and no new config."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = OK
         manager = HotspotManager(config)
+        mock_state = MagicMock(return_value=MagicMock())
 
-        with (
-            patch.object(manager, "is_running", return_value=False),
-            patch.object(manager, "get_state") as mock_state,
-        ):
-            mock_state.return_value = MagicMock()
-            result = manager.restart()
-            mock_state.assert_called_once()
-            assert result == mock_state.return_value
+        monkeypatch.setattr(manager, "is_running", lambda: False)
+        monkeypatch.setattr(manager, "get_state", mock_state)
+
+        result = manager.restart()
+        mock_state.assert_called_once()
+        assert result == mock_state.return_value
 
 
 class TestHotspotManagerUpdateConfig:
@@ -665,11 +711,15 @@ class TestHotspotManagerUpdateConfig:
 class TestHotspotManagerGetState:
     """Tests for get_state method."""
 
-    @patch("subprocess.run")
-    def test_get_state_not_running(self, mock_run: MagicMock, config: HotspotchiConfig):
+    @pytest.fixture(autouse=True)
+    def pgrep(self):
+        """get_state() shells out to pgrep via is_running(); report hostapd as running."""
+        with patch("subprocess.run", return_value=OK) as mock_run:
+            yield mock_run
+
+    def test_get_state_not_running(self, pgrep: MagicMock, manager: HotspotManager):
         """Should return empty state when not running."""
-        mock_run.return_value = MagicMock(returncode=1)  # pgrep returns 1 = not found
-        manager = HotspotManager(config)
+        pgrep.return_value = FAIL  # pgrep returns 1 = not found
 
         state = manager.get_state()
 
@@ -677,22 +727,16 @@ class TestHotspotManagerGetState:
         assert state.ssid == ""
         assert state.mac_address is None
 
-    @patch("subprocess.run")
     @patch("hotspotchi.hotspot.select_combined")
     def test_get_state_running_with_mac_character(
-        self, mock_select: MagicMock, mock_run: MagicMock, config: HotspotchiConfig
+        self,
+        mock_select: MagicMock,
+        config: HotspotchiConfig,
+        manager: HotspotManager,
     ):
         """Should return state with character info when running."""
-        from hotspotchi.characters import CHARACTERS
-        from hotspotchi.selection import SelectionResult
-
-        mock_run.return_value = MagicMock(returncode=0)  # pgrep returns 0 = running
-        mock_select.return_value = SelectionResult(
-            character=CHARACTERS[0],
-            special_ssid=None,
-        )
+        mock_select.return_value = _CHAR_RESULT
 
-        manager = HotspotManager(config)
         state = manager.get_state()
 
         assert state.running is True
@@ -701,22 +745,15 @@ class TestHotspotManagerGetState:
         assert state.character_name == CHARACTERS[0].name
         assert state.mac_address is not None
 
-    @patch("subprocess.run")
     @patch("hotspotchi.hotspot.select_combined")
     def test_get_state_running_with_special_ssid(
-        self, mock_select: MagicMock, mock_run: MagicMock, config: HotspotchiConfig
+        self,
+        mock_select: MagicMock,
+        manager: HotspotManager,
     ):
         """Should return state with special SSID info when running."""
-        from hotspotchi.characters import SPECIAL_SSIDS
-        from hotspotchi.selection import SelectionResult
-
-        mock_run.return_value = MagicMock(returncode=0)
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=SPECIAL_SSIDS[0],
-        )
+        mock_select.return_value = _SPECIAL_RESULT
 
-        manager = HotspotManager(config)
         state = manager.get_state()
 
         assert state.running is True
@@ -724,21 +761,16 @@ class TestHotspotManagerGetState:
         assert state.character_name == SPECIAL_SSIDS[0].character_name
         assert state.mac_address is None
 
-    @patch("subprocess.run")
     @patch("hotspotchi.hotspot.select_combined")
     def test_get_state_running_disabled_mode(
-        self, mock_select: MagicMock, mock_run: MagicMock, config: HotspotchiConfig
+        self,
+        mock_select: MagicMock,
+        config: HotspotchiConfig,
+        manager: HotspotManager,
     ):
         """Should return state with no character when disabled."""
-        from hotspotchi.selection import SelectionResult
+        mock_select.return_value = _EMPTY_RESULT
 
-        mock_run.return_value = MagicMock(returncode=0)
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=None,
-        )
-
-        manager = HotspotManager(config)
         state = manager.get_state()
 
         assert state.running is True
@@ -750,209 +782,70 @@ class TestHotspotManagerGetState:
 class TestHotspotManagerStartFull:
     """Tests for full start() method with mocked dependencies."""
 
-    @patch("hotspotchi.hotspot.time.sleep")
-    @patch("subprocess.Popen")
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("os.geteuid")
-    @patch("hotspotchi.hotspot.select_combined")
-    @patch("hotspotchi.hotspot.Path")
-    def test_start_normal_mode_with_mac_character(
-        self,
-        mock_path: MagicMock,
-        mock_select: MagicMock,
-        mock_geteuid: MagicMock,
-        mock_which: MagicMock,
-        mock_run: MagicMock,
-        mock_popen: MagicMock,
-        _mock_sleep: MagicMock,
-        config: HotspotchiConfig,
-    ):
-        """Should start hotspot with MAC character in normal mode."""
-        from hotspotchi.characters import CHARACTERS
-        from hotspotchi.selection import SelectionResult
-
-        # Setup mocks
-        mock_geteuid.return_value = 0  # Root
-        mock_which.return_value = "/usr/bin/hostapd"
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
-        mock_path.return_value.exists.return_value = True
-        mock_path.return_value.read_text.return_value = "aa:bb:cc:dd:ee:ff\n"
-
-        # Mock select_combined to return a character
-        mock_select.return_value = SelectionResult(
-            character=CHARACTERS[0],
-            special_ssid=None,
-        )
-
-        # Mock Popen for hostapd/dnsmasq
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None  # Process running
-        mock_popen.return_value = mock_process
-
-        manager = HotspotManager(config)
-        state = manager.start()
-
-        assert state.running is True
-        assert state.character_name == CHARACTERS[0].name
-
-    @patch("hotspotchi.hotspot.time.sleep")
-    @patch("subprocess.Popen")
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("os.geteuid")
-    @patch("hotspotchi.hotspot.select_combined")
-    @patch("hotspotchi.hotspot.Path")
-    def test_start_with_special_ssid(
-        self,
-        mock_path: MagicMock,
-        mock_select: MagicMock,
-        mock_geteuid: MagicMock,
-        mock_which: MagicMock,
-        mock_run: MagicMock,
-        mock_popen: MagicMock,
-        _mock_sleep: MagicMock,
-        config: HotspotchiConfig,
-    ):
-        """Should start hotspot with special SSID."""
-        from hotspotchi.characters import SPECIAL_SSIDS
-        from hotspotchi.selection import SelectionResult
-
-        mock_geteuid.return_value = 0
-        mock_which.return_value = "/usr/bin/hostapd"
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
-        mock_path.return_value.exists.return_value = True
-
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=SPECIAL_SSIDS[0],
-        )
-
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_popen.return_value = mock_process
-
-        manager = HotspotManager(config)
-        state = manager.start()
-
-        assert state.running is True
-        assert state.ssid == SPECIAL_SSIDS[0].ssid
-        assert state.character_name == SPECIAL_SSIDS[0].character_name
-
-    @patch("hotspotchi.hotspot.time.sleep")
-    @patch("subprocess.Popen")
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("os.geteuid")
-    @patch("hotspotchi.hotspot.select_combined")
-    @patch("hotspotchi.hotspot.Path")
-    def test_start_disabled_mode(
+    @pytest.fixture
+    def mocks(self):
+        """Patch start()'s collaborators once; defaults describe a healthy start."""
+        with ExitStack() as stack:
+            yield SimpleNamespace(
+                path=stack.enter_context(patch("hotspotchi.hotspot.Path", new=_FakePath())),
+                select=stack.enter_context(patch("hotspotchi.hotspot.select_combined")),
+                run=stack.enter_context(patch("subprocess.run", return_value=OK)),
+                popen=stack.enter_context(patch("subprocess.Popen", return_value=_FakeProc())),
+            )
+
+    @pytest.mark.parametrize(
+        ("selection", "expected_ssid", "expected_character"),
+        [
+            pytest.param(_CHAR_RESULT, None, CHARACTERS[0].name, id="mac_character"),
+            pytest.param(
+                _SPECIAL_RESULT,
+                SPECIAL_SSIDS[0].ssid,
+                SPECIAL_SSIDS[0].character_name,
+                id="special_ssid",
+            ),
+            pytest.param(_EMPTY_RESULT, None, None, id="disabled"),
+        ],
+    )
+    def test_start_variants(
         self,
-        mock_path: MagicMock,
-        mock_select: MagicMock,
-        mock_geteuid: MagicMock,
-        mock_which: MagicMock,
-        mock_run: MagicMock,
-        mock_popen: MagicMock,
-        _mock_sleep: MagicMock,
+        mocks,
         config: HotspotchiConfig,
+        selection: SelectionResult,
+        expected_ssid: str | None,
+        expected_character: str | None,
     ):
-        """Should start hotspot with no character in disabled mode."""
-        from hotspotchi.selection import SelectionResult
-
-        mock_geteuid.return_value = 0
-        mock_which.return_value = "/usr/bin/hostapd"
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
-        mock_path.return_value.exists.return_value = True
-
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=None,
-        )
-
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_popen.return_value = mock_process
+        """Should start with the selected character's SSID (default SSID if None)."""
+        mocks.path.read_text_rv = "aa:bb:cc:dd:ee:ff\n"
+        mocks.select.return_value = selection
 
         manager = HotspotManager(config)
         state = manager.start()
 
         assert state.running is True
-        assert state.ssid == config.default_ssid
-        assert state.character_name is None
+        assert state.ssid == (expected_ssid or config.default_ssid)
+        assert state.character_name == expected_character
 
-    @patch("hotspotchi.hotspot.time.sleep")
-    @patch("subprocess.Popen")
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("os.geteuid")
-    @patch("hotspotchi.hotspot.select_combined")
-    @patch("hotspotchi.hotspot.Path")
-    def test_start_hostapd_fails(
-        self,
-        mock_path: MagicMock,
-        mock_select: MagicMock,
-        mock_geteuid: MagicMock,
-        mock_which: MagicMock,
-        mock_run: MagicMock,
-        mock_popen: MagicMock,
-        _mock_sleep: MagicMock,
-        config: HotspotchiConfig,
-    ):
+    def test_start_hostapd_fails(self, mocks, config: HotspotchiConfig):
         """Should raise error when hostapd fails to start."""
-        from hotspotchi.selection import SelectionResult
-
-        mock_geteuid.return_value = 0
-        mock_which.return_value = "/usr/bin/hostapd"
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
-        mock_path.return_value.exists.return_value = True
-
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=None,
-        )
+        mocks.select.return_value = _EMPTY_RESULT
 
         # hostapd process that fails immediately
-        mock_process = MagicMock()
-        mock_process.poll.return_value = 1  # Process died
-        mock_process.communicate.return_value = (b"Configuration error", b"")
-        mock_popen.return_value = mock_process
+        mocks.popen.return_value = _FakeProc(
+            poll_rv=1, communicate_rv=(b"Configuration error", b"")
+        )
 
         manager = HotspotManager(config)
         with pytest.raises(RuntimeError, match="hostapd failed to start"):
             manager.start()
 
-    @patch("hotspotchi.hotspot.time.sleep")
-    @patch("subprocess.Popen")
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    @patch("os.geteuid")
-    @patch("hotspotchi.hotspot.select_combined")
-    @patch("hotspotchi.hotspot.Path")
     def test_start_concurrent_mode_interface_failure(
-        self,
-        mock_path: MagicMock,
-        mock_select: MagicMock,
-        mock_geteuid: MagicMock,
-        mock_which: MagicMock,
-        mock_run: MagicMock,
-        _mock_popen: MagicMock,
-        _mock_sleep: MagicMock,
-        concurrent_config: HotspotchiConfig,
+        self, mocks, concurrent_config: HotspotchiConfig
     ):
         """Should raise error when virtual interface creation fails."""
-        from hotspotchi.selection import SelectionResult
-
-        mock_geteuid.return_value = 0
-        mock_which.return_value = "/usr/bin/hostapd"
         # Simulate interface creation failure
-        mock_path.return_value.exists.return_value = False
-        mock_run.return_value = MagicMock(returncode=1)
-
-        mock_select.return_value = SelectionResult(
-            character=None,
-            special_ssid=None,
-        )
+        mocks.path.exists_rv = False
+        mocks.run.return_value = FAIL
+        mocks.select.return_value = _EMPTY_RESULT
 
         manager = HotspotManager(concurrent_config)
         with pytest.raises(RuntimeError, match="Failed to create virtual interface"):
@@ -1,25 +1,54 @@
 """Tests for character selection logic."""
 
-from datetime import datetime
+import itertools
+import random
+from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 
-from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS, Character
+import pytest
+
+from hotspotchi.characters import (
+    CHARACTERS,
+    CHARACTERS_BY_SEASON,
+    SPECIAL_SSIDS,
+    Character,
+)
 from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode
+from hotspotchi.exclusions import get_exclusion_manager, reset_exclusion_manager
 from hotspotchi.selection import (
+    PASSWORD_CHARS,
     SelectionResult,
     generate_daily_password,
     get_available_characters,
     get_current_season,
     get_cycle_index,
+    get_cycle_indices,
     get_day_number,
     get_next_character,
     get_seconds_until_midnight,
     get_upcoming_characters,
     is_character_available_now,
+    peek_cycle_index,
     select_character,
+    select_characters,
     select_combined,
 )
 
+# Hashed view of CHARACTERS for membership assertions
+_CHARACTER_SET = frozenset(CHARACTERS)
+
+# ASCII letters and digits; deleting them from a valid password leaves nothing
+_PASSWORD_BYTES = PASSWORD_CHARS.encode()
+
+
+@pytest.fixture
+def restore_global_random():
+    """Put the global RNG state back after a test that seeds it."""
+    state = random.getstate()
+    yield
+    random.setstate(state)
+
 
 class TestGetDayNumber:
     """Tests for day number calculation."""
@@ -41,53 +70,77 @@ class TestGetDayNumber:
         date2 = datetime(2025, 1, 1)
         assert get_day_number(date1) != get_day_number(date2)
 
+    def test_consecutive_days_differ(self):
+        """Every day should differ from the day before, across year boundaries."""
+        start = datetime(2023, 1, 1)
+        numbers = [get_day_number(start + timedelta(days=i)) for i in range(3 * 366)]
+        assert all(a != b for a, b in itertools.pairwise(numbers))
+
     def test_uses_current_time_when_none(self):
         """Should use current datetime when no date provided."""
+        now = datetime.now()
         result = get_day_number()
-        expected = get_day_number(datetime.now())
-        assert result == expected
+        if datetime.now().date() != now.date():
+            pytest.skip("Date rolled over during test")
+        assert result == get_day_number(now)
 
     def test_deterministic(self):
-        """Same date should always give same result."""
+        """Same date should always give the same, pinned result (it seeds daily selection)."""
         date = datetime(2024, 3, 14)  # Pi day
-        results = [get_day_number(date) for _ in range(10)]
-        assert len(set(results)) == 1
+        assert get_day_number(date) == 740891
 
 
+@pytest.mark.xdist_group(name="cycle")
 class TestCycleIndex:
     """Tests for cycle index persistence."""
 
-    def test_starts_at_zero(self, temp_dir: Path):
+    def test_starts_at_zero(self, cycle_file: Path):
         """New cycle file should start at index 0."""
-        cycle_file = temp_dir / "cycle.txt"
         index = get_cycle_index(cycle_file, len(CHARACTERS))
         assert index == 0
 
-    def test_increments_on_each_call(self, temp_dir: Path):
+    def test_increments_on_each_call(self, cycle_storage):
         """Index should increment with each call."""
-        cycle_file = temp_dir / "cycle.txt"
-        indices = [get_cycle_index(cycle_file, 10) for _ in range(5)]
+        indices = [get_cycle_index(cycle_storage, 10) for _ in range(5)]
         assert indices == [0, 1, 2, 3, 4]
+        assert cycle_storage.value == "5"
+
+    def test_takes_several_indices_at_once(self, cycle_storage):
+        """get_cycle_indices should match repeated get_cycle_index calls."""
+        cycle_storage.value = "8"
+        assert get_cycle_indices(cycle_storage, 10, 5) == [8, 9, 0, 1, 2]
+        assert cycle_storage.value == "3"
 
-    def test_wraps_around(self, temp_dir: Path):
+    def test_peek_does_not_advance(self, cycle_storage):
+        """peek_cycle_index should report the next index without storing anything."""
+        cycle_storage.value = "12"
+        assert peek_cycle_index(cycle_storage, 10) == 2
+        assert cycle_storage.value == "12"
+
+    def test_wraps_around(self, cycle_storage):
         """Index should wrap to 0 after reaching end."""
-        cycle_file = temp_dir / "cycle.txt"
-        cycle_file.write_text("9")  # Start at 9 with 10 characters
-        index = get_cycle_index(cycle_file, 10)
-        assert index == 9
-        next_index = get_cycle_index(cycle_file, 10)
-        assert next_index == 0
-
-    def test_handles_corrupted_file(self, temp_dir: Path):
-        """Should handle corrupted cycle file gracefully."""
-        cycle_file = temp_dir / "cycle.txt"
-        cycle_file.write_text("not_a_number")
-        index = get_cycle_index(cycle_file, 10)
-        assert index == 0
+        cycle_storage.value = "9"  # Start at 9 with 10 characters
+        assert get_cycle_index(cycle_storage, 10) == 9
+        assert get_cycle_index(cycle_storage, 10) == 0
+
+    def test_handles_corrupted_value(self, cycle_storage):
+        """Should handle a corrupted stored index gracefully."""
+        cycle_storage.value = "not_a_number"
+        assert get_cycle_index(cycle_storage, 10) == 0
+
+    def test_handles_out_of_range_index(self, cycle_storage):
+        """Should handle index larger than character count."""
+        cycle_storage.value = "100"  # Larger than 10
+        assert get_cycle_index(cycle_storage, 10) == 0
+
+    def test_persists_to_file(self, cycle_file: Path):
+        """A Path should be read and written as a text file."""
+        cycle_file.write_text("3")
+        assert get_cycle_index(cycle_file, 10) == 3
+        assert cycle_file.read_text() == "4"
 
-    def test_handles_missing_file(self, temp_dir: Path):
+    def test_handles_missing_file(self, cycle_file: Path):
         """Should handle missing file gracefully."""
-        cycle_file = temp_dir / "nonexistent.txt"
         index = get_cycle_index(cycle_file, 10)
         assert index == 0
 
@@ -98,13 +151,6 @@ class TestCycleIndex:
         assert index == 0
         assert cycle_file.exists()
 
-    def test_handles_out_of_range_index(self, temp_dir: Path):
-        """Should handle index larger than character count."""
-        cycle_file = temp_dir / "cycle.txt"
-        cycle_file.write_text("100")  # Larger than 10
-        index = get_cycle_index(cycle_file, 10)
-        assert 0 <= index < 10  # Should be wrapped
-
 
 class TestSelectCharacter:
     """Tests for character selection across all modes."""
@@ -128,18 +174,21 @@ class TestSelectCharacter:
         # Note: Could theoretically be same by chance, test passes either way
         assert char1 is not None and char2 is not None
 
-    def test_random_mode_returns_character(self):
+    def test_random_mode_returns_character(self, random_config: HotspotchiConfig):
         """Random mode should return a valid character."""
-        config = HotspotchiConfig(mac_mode=MacMode.RANDOM)
-        char = select_character(config)
-        assert char in CHARACTERS
-
-    def test_random_mode_varies(self):
-        """Random mode should produce variety over many calls."""
-        config = HotspotchiConfig(mac_mode=MacMode.RANDOM)
-        chars = {select_character(config) for _ in range(20)}
-        # Should have at least some variety
-        assert len(chars) > 1
+        char = select_character(random_config)
+        assert char in _CHARACTER_SET
+
+    def test_random_mode_varies(
+        self, monkeypatch: pytest.MonkeyPatch, random_config: HotspotchiConfig
+    ):
+        """Random mode should draw a fresh pick from the RNG on every call."""
+        picks = itertools.count()
+        monkeypatch.setattr(
+            "hotspotchi.selection.random.choice", lambda seq: seq[next(picks) % len(seq)]
+        )
+        chars = {select_character(random_config) for _ in range(3)}
+        assert len(chars) == 3
 
     def test_fixed_mode_correct_index(self, fixed_config: HotspotchiConfig):
         """Fixed mode should return character at specified index."""
@@ -186,6 +235,47 @@ class TestSelectCharacter:
         assert char is None
 
 
+class TestSelectCharacters:
+    """Tests for batch character selection."""
+
+    def test_random_mode_returns_n_characters(self, random_config: HotspotchiConfig):
+        """Random mode should return n characters from the pool."""
+        chars = select_characters(random_config, 20)
+        assert len(chars) == 20
+        assert all(char in _CHARACTER_SET for char in chars)
+
+    @pytest.mark.usefixtures("restore_global_random")
+    def test_random_mode_varies(self, random_config: HotspotchiConfig):
+        """A batch of random picks should not all be the same character."""
+        random.seed(0)
+        assert len(set(select_characters(random_config, 20))) > 1
+
+    def test_daily_random_matches_single_selection(self):
+        """Daily random should repeat the day's character."""
+        config = HotspotchiConfig(mac_mode=MacMode.DAILY_RANDOM)
+        date = datetime(2024, 6, 15)
+        expected = select_character(config, current_date=date)
+        assert select_characters(config, 3, current_date=date) == [expected] * 3
+
+    def test_fixed_mode_repeats_character(self, fixed_config: HotspotchiConfig):
+        """Fixed mode should repeat the fixed character."""
+        assert select_characters(fixed_config, 3) == [CHARACTERS[5]] * 3
+
+    def test_cycle_mode_advances(self, cycle_config: HotspotchiConfig):
+        """Cycle mode should advance once per selection."""
+        first, second = select_characters(cycle_config, 2)
+        assert first != second
+
+    def test_disabled_mode_returns_empty(self):
+        """Disabled mode should return an empty list."""
+        config = HotspotchiConfig(mac_mode=MacMode.DISABLED)
+        assert select_characters(config, 5) == []
+
+    def test_zero_count_returns_empty(self, random_config: HotspotchiConfig):
+        """Requesting no characters should return an empty list."""
+        assert select_characters(random_config, 0) == []
+
+
 class TestGetNextCharacter:
     """Tests for next character preview."""
 
@@ -198,7 +288,7 @@ class TestGetNextCharacter:
         """Should return next character for cycle mode."""
         char = get_next_character(cycle_config)
         assert char is not None
-        assert char in CHARACTERS
+        assert char in _CHARACTER_SET
 
 
 class TestGetUpcomingCharacters:
@@ -222,6 +312,17 @@ class TestGetUpcomingCharacters:
         assert upcoming[1] == CHARACTERS[1]
         assert upcoming[2] == CHARACTERS[2]
 
+    def test_wraps_around_roster(self, cycle_config: HotspotchiConfig):
+        """Upcoming list should continue from the start after the last character."""
+        cycle_config.cycle_file.write_text(str(len(CHARACTERS) - 1))
+        upcoming = get_upcoming_characters(cycle_config, count=2)
+        assert upcoming == [CHARACTERS[-1], CHARACTERS[0]]
+
+    def test_negative_count_returns_empty(self, cycle_config: HotspotchiConfig):
+        """A negative count should give an empty list, not raise."""
+        cycle_config.cycle_file.write_text("3")
+        assert get_upcoming_characters(cycle_config, count=-100) == []
+
 
 class TestGetSecondsUntilMidnight:
     """Tests for midnight countdown."""
@@ -244,6 +345,15 @@ class TestGetSecondsUntilMidnight:
         # At most 24 hours
         assert seconds <= 86400
 
+    def test_counts_down_to_local_midnight(self, monkeypatch: pytest.MonkeyPatch):
+        """Should measure against local midnight, not UTC midnight."""
+        # 2024-06-15 22:00:00 UTC, observed from UTC+1 (23:00 local)
+        monkeypatch.setattr("hotspotchi.selection.time.time", lambda: 1718488800.0)
+        monkeypatch.setattr(
+            "hotspotchi.selection.time.localtime", lambda _: SimpleNamespace(tm_gmtoff=3600)
+        )
+        assert get_seconds_until_midnight() == 3600
+
 
 class TestGenerateDailyPassword:
     """Tests for daily password generation."""
@@ -263,20 +373,17 @@ class TestGenerateDailyPassword:
         password2 = generate_daily_password(date2)
         assert password1 != password2
 
-    def test_password_length(self):
+    def test_password_length(self, todays_password: str):
         """Password should be 16 characters."""
-        password = generate_daily_password()
-        assert len(password) == 16
+        assert len(todays_password) == 16
 
-    def test_password_alphanumeric(self):
-        """Password should only contain alphanumeric characters."""
-        password = generate_daily_password()
-        assert password.isalnum()
+    def test_password_alphanumeric(self, todays_password: str):
+        """Password should only contain ASCII letters and digits."""
+        assert not todays_password.encode().translate(None, _PASSWORD_BYTES)
 
-    def test_wpa2_minimum_length(self):
+    def test_wpa2_minimum_length(self, todays_password: str):
         """Password should meet WPA2 minimum length requirement (8 chars)."""
-        password = generate_daily_password()
-        assert len(password) >= 8
+        assert len(todays_password) >= 8
 
     def test_deterministic(self):
         """Same date should always give same password."""
@@ -284,6 +391,23 @@ class TestGenerateDailyPassword:
         results = [generate_daily_password(date) for _ in range(10)]
         assert len(set(results)) == 1
 
+    def test_year_of_passwords_is_unique_and_valid(self, precomputed_year_passwords):
+        """Every day of a year should get its own 16-character alphanumeric password."""
+        passwords = list(precomputed_year_passwords.values())
+        assert len(set(passwords)) == len(passwords)
+        assert all(
+            len(p) == 16 and not p.encode().translate(None, _PASSWORD_BYTES) for p in passwords
+        )
+
+    @pytest.mark.usefixtures("restore_global_random")
+    def test_does_not_reseed_global_random(self):
+        """Password generation should leave the module-level RNG untouched."""
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        generate_daily_password(datetime(2024, 6, 15))
+        assert random.random() == expected
+
     def test_different_from_character_selection(self):
         """Password seed should differ from character selection seed."""
         # This ensures the password and character don't use the exact same RNG state
@@ -297,59 +421,41 @@ class TestGenerateDailyPassword:
 class TestSelectCombined:
     """Tests for combined character and special SSID selection."""
 
-    def test_returns_selection_result(self):
+    def test_returns_selection_result(self, random_config: HotspotchiConfig):
         """Should always return a SelectionResult object."""
-        config = HotspotchiConfig(mac_mode=MacMode.RANDOM)
-        result = select_combined(config)
+        result = select_combined(random_config)
         assert isinstance(result, SelectionResult)
 
-    def test_special_ssid_mode_returns_special_ssid(self):
+    def test_special_ssid_mode_returns_special_ssid(self, special_ssid_config):
         """Special SSID mode should return a special SSID, not a character."""
-        config = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.SPECIAL,
-            special_ssid_index=0,
-        )
-        result = select_combined(config)
+        result = select_combined(special_ssid_config)
         assert result.is_special_ssid is True
-        assert result.special_ssid is not None
         assert result.special_ssid == SPECIAL_SSIDS[0]
         assert result.character is None
+        assert result.name == SPECIAL_SSIDS[0].character_name
+        assert result.ssid == SPECIAL_SSIDS[0].ssid
 
-    def test_special_ssid_mode_respects_index(self):
-        """Special SSID mode should use the configured index."""
-        if len(SPECIAL_SSIDS) < 3:
-            return  # Skip if not enough special SSIDs
-        config = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.SPECIAL,
-            special_ssid_index=2,
-        )
-        result = select_combined(config)
-        assert result.special_ssid == SPECIAL_SSIDS[2]
-
-    def test_special_ssid_mode_clamps_high_index(self):
-        """Special SSID mode should clamp too-high index to last SSID."""
-        config = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.SPECIAL,
-            special_ssid_index=9999,
-        )
-        result = select_combined(config)
-        assert result.special_ssid == SPECIAL_SSIDS[-1]
-
-    def test_fixed_mode_returns_character(self):
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [
+            pytest.param(0, 0, id="first"),
+            pytest.param(2, 2, id="respects_index"),
+            pytest.param(9999, -1, id="clamps_high_index"),
+        ],
+    )
+    def test_special_ssid_mode_index(self, index: int, expected: int):
+        """Special SSID mode should use the configured index, clamped to the last SSID."""
+        config = HotspotchiConfig(ssid_mode=SsidMode.SPECIAL, special_ssid_index=index)
+        assert select_combined(config).special_ssid == SPECIAL_SSIDS[expected]
+
+    def test_fixed_mode_returns_character(self, fixed_config):
         """Fixed mode (without special SSID mode) should return a character."""
-        config = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.NORMAL,
-            fixed_character_index=5,
-        )
-        result = select_combined(config)
+        result = select_combined(fixed_config)
         assert result.is_special_ssid is False
-        assert result.character is not None
         assert result.character == CHARACTERS[5]
         assert result.special_ssid is None
+        assert result.name == CHARACTERS[5].name
+        assert result.ssid is None
 
     def test_disabled_mode_returns_empty_result(self):
         """Disabled mode should return an empty SelectionResult."""
@@ -359,12 +465,11 @@ class TestSelectCombined:
         assert result.special_ssid is None
         assert result.name is None
 
-    def test_random_mode_returns_character(self):
+    def test_random_mode_returns_character(self, random_no_special_config: HotspotchiConfig):
         """Random mode should return a character from the pool."""
-        config = HotspotchiConfig(mac_mode=MacMode.RANDOM, include_special_ssids=False)
-        result = select_combined(config)
+        result = select_combined(random_no_special_config)
         assert result.character is not None
-        assert result.character in CHARACTERS
+        assert result.character in _CHARACTER_SET
 
     def test_daily_random_same_day_same_result(self):
         """Daily random should return same selection for same day."""
@@ -374,9 +479,8 @@ class TestSelectCombined:
         result2 = select_combined(config, current_date=fixed_date)
         assert result1.name == result2.name
 
-    def test_cycle_mode_with_temp_file(self, temp_dir: Path):
+    def test_cycle_mode_with_temp_file(self, cycle_file: Path):
         """Cycle mode should progress through selections."""
-        cycle_file = temp_dir / "cycle.txt"
         config = HotspotchiConfig(
             mac_mode=MacMode.CYCLE,
             cycle_file=cycle_file,
@@ -386,10 +490,9 @@ class TestSelectCombined:
         result2 = select_combined(config)
         assert result1.character != result2.character
 
-    def test_include_special_ssids_expands_pool(self, temp_dir: Path):
+    def test_include_special_ssids_expands_pool(self, cycle_file: Path):
         """With include_special_ssids, pool should include both characters and SSIDs."""
         # Use cycle mode to deterministically hit different items
-        cycle_file = temp_dir / "cycle.txt"
         config = HotspotchiConfig(
             mac_mode=MacMode.CYCLE,
             cycle_file=cycle_file,
@@ -405,70 +508,30 @@ class TestSelectCombined:
         if active_ssids:
             assert result.is_special_ssid is True
 
-    def test_selection_result_name_property(self):
-        """SelectionResult.name should work for both types."""
-        config_char = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.NORMAL,
-            fixed_character_index=0,
-        )
-        result_char = select_combined(config_char)
-        assert result_char.name == CHARACTERS[0].name
-
-        config_ssid = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.SPECIAL,
-            special_ssid_index=0,
-        )
-        result_ssid = select_combined(config_ssid)
-        assert result_ssid.name == SPECIAL_SSIDS[0].character_name
-
-    def test_selection_result_ssid_property(self):
-        """SelectionResult.ssid should return SSID for special SSID selections."""
-        config = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.SPECIAL,
-            special_ssid_index=0,
-        )
-        result = select_combined(config)
-        assert result.ssid == SPECIAL_SSIDS[0].ssid
-
-        # Regular character should return None for ssid
-        config_char = HotspotchiConfig(
-            mac_mode=MacMode.FIXED,
-            ssid_mode=SsidMode.NORMAL,
-            fixed_character_index=0,
-        )
-        result_char = select_combined(config_char)
-        assert result_char.ssid is None
-
 
 class TestGetCurrentSeason:
     """Tests for season detection."""
 
-    def test_spring_months(self):
-        """March, April, May should be spring."""
-        assert get_current_season(datetime(2024, 3, 1)) == "spring"
-        assert get_current_season(datetime(2024, 4, 15)) == "spring"
-        assert get_current_season(datetime(2024, 5, 31)) == "spring"
-
-    def test_summer_months(self):
-        """June, July, August should be summer."""
-        assert get_current_season(datetime(2024, 6, 1)) == "summer"
-        assert get_current_season(datetime(2024, 7, 15)) == "summer"
-        assert get_current_season(datetime(2024, 8, 31)) == "summer"
-
-    def test_fall_months(self):
-        """September, October, November should be fall."""
-        assert get_current_season(datetime(2024, 9, 1)) == "fall"
-        assert get_current_season(datetime(2024, 10, 15)) == "fall"
-        assert get_current_season(datetime(2024, 11, 30)) == "fall"
-
-    def test_winter_months(self):
-        """December, January, February should be winter."""
-        assert get_current_season(datetime(2024, 12, 1)) == "winter"
-        assert get_current_season(datetime(2024, 1, 15)) == "winter"
-        assert get_current_season(datetime(2024, 2, 28)) == "winter"
+    @pytest.mark.parametrize(
+        ("date", "expected"),
+        [
+            pytest.param(datetime(2024, 3, 1), "spring", id="march"),
+            pytest.param(datetime(2024, 4, 15), "spring", id="april"),
+            pytest.param(datetime(2024, 5, 31), "spring", id="may"),
+            pytest.param(datetime(2024, 6, 1), "summer", id="june"),
+            pytest.param(datetime(2024, 7, 15), "summer", id="july"),
+            pytest.param(datetime(2024, 8, 31), "summer", id="august"),
+            pytest.param(datetime(2024, 9, 1), "fall", id="september"),
+            pytest.param(datetime(2024, 10, 15), "fall", id="october"),
+            pytest.param(datetime(2024, 11, 30), "fall", id="november"),
+            pytest.param(datetime(2024, 12, 1), "winter", id="december"),
+            pytest.param(datetime(2024, 1, 15), "winter", id="january"),
+            pytest.param(datetime(2024, 2, 28), "winter", id="february"),
+        ],
+    )
+    def test_season_for_month(self, date: datetime, expected: str):
+        """Months should map to spring (3-5), summer (6-8), fall (9-11) and winter (12, 1-2)."""
+        assert get_current_season(date) == expected
 
     def test_uses_current_date_when_none(self):
         """Should use current datetime when no date provided."""
@@ -488,47 +551,37 @@ class TestIsCharacterAvailableNow:
         assert is_character_available_now(char, datetime(2024, 7, 1)) is True
         assert is_character_available_now(char, datetime(2024, 10, 1)) is True
 
-    def test_spring_character_in_spring(self):
-        """Spring character should be available in spring."""
-        char = Character(byte1=0, byte2=0x0F, name="SpringChar", season="spring")
-        assert is_character_available_now(char, datetime(2024, 3, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 4, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 5, 15)) is True
-
-    def test_spring_character_not_in_other_seasons(self):
-        """Spring character should not be available in other seasons."""
-        char = Character(byte1=0, byte2=0x0F, name="SpringChar", season="spring")
-        assert is_character_available_now(char, datetime(2024, 6, 15)) is False  # Summer
-        assert is_character_available_now(char, datetime(2024, 9, 15)) is False  # Fall
-        assert is_character_available_now(char, datetime(2024, 12, 15)) is False  # Winter
-
-    def test_summer_character_availability(self):
-        """Summer character should only be available in summer."""
-        char = Character(byte1=0, byte2=0x0E, name="SummerChar", season="summer")
-        assert is_character_available_now(char, datetime(2024, 7, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 3, 15)) is False
-
-    def test_fall_character_availability(self):
-        """Fall character should only be available in fall."""
-        char = Character(byte1=0, byte2=0x0D, name="FallChar", season="fall")
-        assert is_character_available_now(char, datetime(2024, 10, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 6, 15)) is False
-
-    def test_winter_character_availability(self):
-        """Winter character should only be available in winter."""
-        char = Character(byte1=0, byte2=0x0C, name="WinterChar", season="winter")
-        assert is_character_available_now(char, datetime(2024, 12, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 1, 15)) is True
-        assert is_character_available_now(char, datetime(2024, 6, 15)) is False
-
-
+    @pytest.mark.parametrize(
+        ("season", "date", "expected"),
+        [
+            pytest.param("spring", datetime(2024, 3, 15), True, id="spring_in_march"),
+            pytest.param("spring", datetime(2024, 4, 15), True, id="spring_in_april"),
+            pytest.param("spring", datetime(2024, 5, 15), True, id="spring_in_may"),
+            pytest.param("spring", datetime(2024, 6, 15), False, id="spring_in_summer"),
+            pytest.param("spring", datetime(2024, 9, 15), False, id="spring_in_fall"),
+            pytest.param("spring", datetime(2024, 12, 15), False, id="spring_in_winter"),
+            pytest.param("summer", datetime(2024, 7, 15), True, id="summer_in_summer"),
+            pytest.param("summer", datetime(2024, 3, 15), False, id="summer_in_spring"),
+            pytest.param("fall", datetime(2024, 10, 15), True, id="fall_in_fall"),
+            pytest.param("fall", datetime(2024, 6, 15), False, id="fall_in_summer"),
+            pytest.param("winter", datetime(2024, 12, 15), True, id="winter_in_december"),
+            pytest.param("winter", datetime(2024, 1, 15), True, id="winter_in_january"),
+            pytest.param("winter", datetime(2024, 6, 15), False, id="winter_in_summer"),
+        ],
+    )
+    def test_seasonal_character_availability(self, season: str, date: datetime, expected: bool):
+        """Seasonal characters should only be available during their own season."""
+        char = Character(byte1=0, byte2=0x0F, name=f"{season.title()}Char", season=season)
+        assert is_character_available_now(char, date) is expected
+
+
+@pytest.mark.xdist_group(name="seasonal")
 class TestGetAvailableCharactersSeasonalFiltering:
     """Tests for seasonal filtering in get_available_characters."""
 
-    def test_filters_out_wrong_season(self):
+    def test_filters_out_wrong_season(self, winter_date: datetime):
         """Should filter out characters not in current season."""
         # In December (winter), spring/summer/fall characters should be filtered
-        winter_date = datetime(2024, 12, 15)
         available = get_available_characters(
             CHARACTERS,
             respect_exclusions=False,
@@ -543,10 +596,9 @@ class TestGetAvailableCharactersSeasonalFiltering:
                     f"Found {char.season} character {char.name} in winter"
                 )
 
-    def test_includes_current_season(self):
+    def test_includes_current_season(self, spring_date: datetime):
         """Should include characters from current season."""
         # In spring, spring characters should be available
-        spring_date = datetime(2024, 4, 15)
         available = get_available_characters(
             CHARACTERS,
             respect_exclusions=False,
@@ -554,14 +606,12 @@ class TestGetAvailableCharactersSeasonalFiltering:
             current_date=spring_date,
         )
 
-        # Find a spring character to verify it's included
-        spring_chars = [c for c in CHARACTERS if c.season == "spring"]
-        for spring_char in spring_chars:
+        # Every spring character should be included
+        for spring_char in CHARACTERS_BY_SEASON["spring"]:
             assert spring_char in available, f"Spring character {spring_char.name} missing"
 
-    def test_includes_non_seasonal_characters(self):
+    def test_includes_non_seasonal_characters(self, winter_date: datetime):
         """Non-seasonal characters should always be included."""
-        winter_date = datetime(2024, 12, 15)
         available = get_available_characters(
             CHARACTERS,
             respect_exclusions=False,
@@ -570,13 +620,11 @@ class TestGetAvailableCharactersSeasonalFiltering:
         )
 
         # All non-seasonal characters should be present
-        non_seasonal = [c for c in CHARACTERS if c.season is None]
-        for char in non_seasonal:
+        for char in CHARACTERS_BY_SEASON[None]:
             assert char in available, f"Non-seasonal character {char.name} missing"
 
-    def test_can_disable_seasonal_filtering(self):
+    def test_can_disable_seasonal_filtering(self, winter_date: datetime):
         """Should be able to disable seasonal filtering."""
-        winter_date = datetime(2024, 12, 15)
         available = get_available_characters(
             CHARACTERS,
             respect_exclusions=False,
@@ -587,7 +635,25 @@ class TestGetAvailableCharactersSeasonalFiltering:
         # With filtering disabled, should have all characters
         assert len(available) == len(CHARACTERS)
 
-
+    def test_keeps_roster_order(self, winter_date: datetime):
+        """The seasonal pool should keep CHARACTERS order (daily picks depend on it)."""
+        available = get_available_characters(respect_exclusions=False, current_date=winter_date)
+        expected = tuple(c for c in CHARACTERS if is_character_available_now(c, winter_date))
+        assert available == expected
+
+    def test_respects_exclusions(self, winter_date: datetime, temp_dir: Path):
+        """Excluded characters should be dropped from the seasonal pool."""
+        reset_exclusion_manager()
+        try:
+            get_exclusion_manager(temp_dir / "exclusions.json").exclude(0)
+            available = get_available_characters(current_date=winter_date)
+        finally:
+            reset_exclusion_manager()
+        assert CHARACTERS[0] not in available
+        assert CHARACTERS[1] in available
+
+
+@pytest.mark.xdist_group(name="seasonal")
 class TestSelectCharacterSeasonalFiltering:
     """Tests for seasonal filtering in select_character."""
 
@@ -603,45 +669,32 @@ class TestSelectCharacterSeasonalFiltering:
             if char.season is not None:
                 assert char.season == "winter", f"Got {char.season} character on winter day"
 
-    def test_random_respects_season(self):
+    def test_random_respects_season(self, summer_date: datetime, random_config: HotspotchiConfig):
         """Random mode should only select seasonally appropriate characters."""
-        summer_date = datetime(2024, 7, 15)
-        config = HotspotchiConfig(mac_mode=MacMode.RANDOM)
 
-        # Run selection multiple times
-        for _ in range(20):
-            char = select_character(config, current_date=summer_date)
-            assert char is not None
+        for char in select_characters(random_config, 20, current_date=summer_date):
             if char.season is not None:
                 assert char.season == "summer", f"Got {char.season} character in summer"
 
-    def test_fixed_mode_ignores_season(self):
+    def test_fixed_mode_ignores_season(self, winter_date: datetime):
         """Fixed mode should allow selecting any character regardless of season."""
-        # Find a spring character index
-        spring_idx = None
-        for i, char in enumerate(CHARACTERS):
-            if char.season == "spring":
-                spring_idx = i
-                break
-
-        if spring_idx is not None:
-            winter_date = datetime(2024, 12, 15)
-            config = HotspotchiConfig(
-                mac_mode=MacMode.FIXED,
-                fixed_character_index=spring_idx,
-            )
-            char = select_character(config, current_date=winter_date)
-            # Fixed mode should return the spring character even in winter
-            assert char is not None
-            assert char.season == "spring"
+        spring_idx = CHARACTERS.index(CHARACTERS_BY_SEASON["spring"][0])
+        config = HotspotchiConfig(
+            mac_mode=MacMode.FIXED,
+            fixed_character_index=spring_idx,
+        )
+        char = select_character(config, current_date=winter_date)
+        # Fixed mode should return the spring character even in winter
+        assert char is not None
+        assert char.season == "spring"
 
 
+@pytest.mark.xdist_group(name="seasonal")
 class TestSelectCombinedSeasonalFiltering:
     """Tests for seasonal filtering in select_combined."""
 
-    def test_combined_respects_season(self):
+    def test_combined_respects_season(self, fall_date: datetime):
         """Combined selection should respect seasonal filtering."""
-        fall_date = datetime(2024, 10, 15)
         config = HotspotchiConfig(
             mac_mode=MacMode.RANDOM,
             include_special_ssids=False,
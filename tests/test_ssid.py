@@ -1,6 +1,8 @@
 """Tests for SSID resolution logic."""
 
-from hotspotchi.characters import SPECIAL_SSIDS
+from unittest.mock import patch
+
+from hotspotchi.characters import INACTIVE_SSID_COUNT, SPECIAL_SSIDS
 from hotspotchi.config import HotspotchiConfig, SsidMode
 from hotspotchi.ssid import (
     find_ssid_by_character,
@@ -12,6 +14,12 @@ from hotspotchi.ssid import (
     resolve_ssid,
 )
 
+# SSID fields the lookup tests compare against, read once
+_FIRST_SSID = SPECIAL_SSIDS[0].ssid
+_FIRST_CHAR = SPECIAL_SSIDS[0].character_name
+_LAST_SSID = SPECIAL_SSIDS[-1].ssid
+_ALL_SSID_STRINGS = [s.ssid for s in SPECIAL_SSIDS]
+
 
 class TestResolveSsid:
     """Tests for SSID resolution."""
@@ -32,8 +40,8 @@ class TestResolveSsid:
         """Special mode should return special SSID and character."""
         ssid, char = resolve_ssid(special_ssid_config)
         # First special SSID is Angel & Devil
-        assert ssid == SPECIAL_SSIDS[0].ssid
-        assert char == SPECIAL_SSIDS[0].character_name
+        assert ssid == _FIRST_SSID
+        assert char == _FIRST_CHAR
 
     def test_special_mode_index_bounds(self):
         """Special mode should clamp to valid index."""
@@ -43,7 +51,7 @@ class TestResolveSsid:
         )
         ssid, char = resolve_ssid(config)
         # Should get last SSID, not crash
-        assert ssid == SPECIAL_SSIDS[-1].ssid
+        assert ssid == _LAST_SSID
         assert char is not None
 
     def test_custom_mode_without_ssid(self):
@@ -81,10 +89,9 @@ class TestFindSsidBySsidString:
 
     def test_find_existing_ssid(self):
         """Should find by SSID string."""
-        first_ssid = SPECIAL_SSIDS[0].ssid
-        result = find_ssid_by_ssid_string(first_ssid)
+        result = find_ssid_by_ssid_string(_FIRST_SSID)
         assert result is not None
-        assert result.ssid == first_ssid
+        assert result.ssid == _FIRST_SSID
 
     def test_not_found_returns_none(self):
         """Should return None for unknown SSID."""
@@ -97,9 +104,7 @@ class TestGetSsidIndex:
 
     def test_find_existing_ssid_index(self):
         """Should find index for existing SSID."""
-        first_ssid = SPECIAL_SSIDS[0].ssid
-        index = get_ssid_index(first_ssid)
-        assert index == 0
+        assert get_ssid_index(_FIRST_SSID) == 0
 
     def test_not_found_returns_none(self):
         """Should return None for unknown SSID."""
@@ -108,8 +113,8 @@ class TestGetSsidIndex:
 
     def test_all_ssids_have_index(self):
         """All SSIDs should be findable by index."""
-        for i, ssid in enumerate(SPECIAL_SSIDS):
-            assert get_ssid_index(ssid.ssid) == i
+        for i, ssid_string in enumerate(_ALL_SSID_STRINGS):
+            assert get_ssid_index(ssid_string) == i
 
 
 class TestGetSsidIndexByCharacter:
@@ -117,15 +122,11 @@ class TestGetSsidIndexByCharacter:
 
     def test_find_by_character_name(self):
         """Should find index by character name."""
-        first_char = SPECIAL_SSIDS[0].character_name
-        index = get_ssid_index_by_character(first_char)
-        assert index == 0
+        assert get_ssid_index_by_character(_FIRST_CHAR) == 0
 
     def test_case_insensitive(self):
         """Should be case insensitive."""
-        first_char = SPECIAL_SSIDS[0].character_name.lower()
-        index = get_ssid_index_by_character(first_char)
-        assert index == 0
+        assert get_ssid_index_by_character(_FIRST_CHAR.lower()) == 0
 
     def test_not_found_returns_none(self):
         """Should return None for unknown character."""
@@ -160,6 +161,12 @@ class TestIsValidSsid:
         """Should reject SSID over 32 characters."""
         assert not is_valid_ssid("a" * 33)
 
+    def test_too_long_rejected_before_content(self):
+        """Oversized input should be rejected on length alone, without a content scan."""
+        with patch("hotspotchi.ssid._NON_PRINTABLE") as content_check:
+            assert not is_valid_ssid("a" * 10_000)
+        content_check.search.assert_not_called()
+
     def test_empty_string(self):
         """Should reject empty SSID."""
         assert not is_valid_ssid("")
@@ -168,6 +175,14 @@ class TestIsValidSsid:
         """Should reject non-printable characters."""
         assert not is_valid_ssid("Network\x00")
 
+    def test_delete_character(self):
+        """Should reject the DEL control character."""
+        assert not is_valid_ssid("Network\x7f")
+
+    def test_non_ascii(self):
+        """Should reject characters outside printable ASCII."""
+        assert not is_valid_ssid("Café")
+
     def test_all_special_ssids_valid(self):
         """All special SSIDs should pass validation."""
         for ssid in SPECIAL_SSIDS:
@@ -188,11 +203,8 @@ class TestListSpecialSsids:
 
     def test_active_only_filters(self):
         """Should filter inactive SSIDs when requested."""
-        all_ssids = list_special_ssids(active_only=False)
         active_ssids = list_special_ssids(active_only=True)
-
-        inactive_count = sum(1 for _, s in all_ssids if not s.active)
-        assert len(active_ssids) == len(all_ssids) - inactive_count
+        assert len(active_ssids) == len(SPECIAL_SSIDS) - INACTIVE_SSID_COUNT
 
     def test_active_only_all_active(self):
         """Active-only list should only contain active SSIDs."""
@@ -1,43 +1,185 @@
-"""Tests for web API routes."""
+"""Tests for web API routes.
 
+The module carries no xdist_group: every test resets the routes config and the
+exclusions through autouse fixtures, so --dist=loadgroup may spread it across workers.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 
 from hotspotchi.characters import CHARACTERS, SPECIAL_SSIDS
-from hotspotchi.exclusions import get_exclusion_manager
-from hotspotchi.web.app import app
+from hotspotchi.config import HotspotchiConfig, MacMode, SsidMode
+from hotspotchi.exclusions import ExclusionManager, get_exclusion_manager
+from hotspotchi.web.routes import CharacterResponse, SpecialSSIDResponse, StatusResponse
+
+# Roster sizes the count fields are checked against
+_N_CHARACTERS = len(CHARACTERS)
+_N_SSIDS = len(SPECIAL_SSIDS)
+# One character and one special SSID excluded; see with_excluded_state
+_EXCLUDED_STATE = (frozenset({0}), frozenset({0}))
+
+
+def _post_json(client: TestClient, path: str, **kwargs) -> dict:
+    """POST to path, assert it succeeded, and return the decoded body."""
+    response = client.post(path, **kwargs)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _post_ok(client: TestClient, path: str, json: dict | None = None, **expected) -> dict:
+    """POST to path, assert an "ok" status plus any expected fields, and return the body."""
+    data = _post_json(client, path, json=json)
+    assert data["status"] == "ok"
+    for key, value in expected.items():
+        assert data[key] == value, key
+    return data
+
+
+@pytest.fixture(scope="module")
+def client(web_app: FastAPI) -> TestClient:
+    """Share one client across the module.
+
+    The app has no startup or shutdown handlers, so the client is not entered
+    as a context manager and the lifespan protocol is never run. TestClient
+    already calls the app in-process; httpx's ASGITransport is async-only and
+    cannot back a synchronous httpx.Client.
+    """
+    return TestClient(web_app)
 
 
 @pytest.fixture
-def client():
-    """Create a test client with a fresh app instance."""
-    # Reset the exclusion manager state before each test
+async def async_client(web_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Async client for tests that send requests concurrently.
+
+    Like the sync client, it never runs the app's lifespan: ASGITransport only sends
+    HTTP scopes.
+    """
+    transport = httpx.ASGITransport(app=web_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _in_memory_exclusions():
+    """Keep exclusion changes in memory; persistence is covered in test_exclusions."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ExclusionManager, "_save", lambda _self: None)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _preserve_exclusions():
+    """Put back whatever exclusions were in place before this module ran."""
     exclusion_manager = get_exclusion_manager()
-    exclusion_manager.clear_all()
+    snapshot = exclusion_manager._snapshot()
+    yield
+    exclusion_manager._restore(snapshot)
+
+
+@pytest.fixture(autouse=True)
+def _reset_exclusions(_preserve_exclusions: None) -> None:
+    """Start each test with no exclusions, in memory only."""
+    get_exclusion_manager()._restore((frozenset(), frozenset()))
+
 
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture(autouse=True)
+def _reset_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test from the default config, putting the original back afterwards."""
+    monkeypatch.setattr("hotspotchi.web.routes._current_config", HotspotchiConfig())
+
+
+@pytest.fixture
+def set_config(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Replace the routes' current config directly, for tests whose subject is another endpoint."""
+
+    def _set(**fields) -> None:
+        monkeypatch.setattr("hotspotchi.web.routes._current_config", HotspotchiConfig(**fields))
+
+    return _set
+
+
+@pytest.fixture
+def exclusion_manager() -> ExclusionManager:
+    """Set up exclusions directly, for tests whose subject is another endpoint."""
+    return get_exclusion_manager()
+
+
+@pytest.fixture
+def with_excluded_state(exclusion_manager: ExclusionManager) -> ExclusionManager:
+    """Exclude character 0 and SSID 0 by restoring a frozen snapshot."""
+    exclusion_manager._restore(_EXCLUDED_STATE)
+    return exclusion_manager
+
+
+def _get_default(client: TestClient, path: str) -> Any:
+    """GET path with no exclusions and the default config, and return the decoded body."""
+    exclusion_manager = get_exclusion_manager()
+    snapshot = exclusion_manager._snapshot()
+    exclusion_manager._restore((frozenset(), frozenset()))
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("hotspotchi.web.routes._current_config", HotspotchiConfig())
+            response = client.get(path)
+    finally:
+        exclusion_manager._restore(snapshot)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def status_info(client: TestClient) -> dict:
+    """GET /api/status in the default state, fetched once per module (do not mutate)."""
+    return _get_default(client, "/api/status")
+
+
+@pytest.fixture(scope="module")
+def characters_list(client: TestClient) -> list[dict]:
+    """GET /api/characters in the default state, fetched once per module (do not mutate)."""
+    return _get_default(client, "/api/characters")
+
+
+@pytest.fixture(scope="module")
+def ssids_list(client: TestClient) -> list[dict]:
+    """GET /api/ssids in the default state, fetched once per module (do not mutate)."""
+    return _get_default(client, "/api/ssids")
+
+
+@pytest.fixture(scope="module")
+def debug_info(client: TestClient) -> dict:
+    """GET /api/debug in the default state, fetched once per module (do not mutate).
+
+    The pgrep/ip/systemctl probes are stubbed out; the tests only check the payload shape.
+    """
+    with patch("hotspotchi.web.routes._run_cmd", return_value="") as run_cmd:
+        data = _get_default(client, "/api/debug")
+    assert run_cmd.called
+    return data
 
 
 class TestSSIDExclusionEndpoints:
     """Tests for SSID exclusion API endpoints."""
 
-    def test_list_ssids_includes_excluded_field(self, client: TestClient):
+    def test_list_ssids_includes_excluded_field(self, ssids_list: list[dict]):
         """GET /api/ssids should include excluded field for each SSID."""
-        response = client.get("/api/ssids")
-        assert response.status_code == 200
-        ssids = response.json()
-        assert len(ssids) > 0
-        # Each SSID should have an 'excluded' field
-        for ssid in ssids:
-            assert "excluded" in ssid
-            assert isinstance(ssid["excluded"], bool)
-
-    def test_list_ssids_available_only_filter(self, client: TestClient):
+        assert len(ssids_list) > 0
+        # Every SSID matches the response model and carries a boolean excluded flag
+        TypeAdapter(list[SpecialSSIDResponse]).validate_python(ssids_list)
+        assert {type(ssid.get("excluded")) for ssid in ssids_list} == {bool}
+
+    def test_list_ssids_available_only_filter(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """GET /api/ssids?available_only=true should exclude excluded SSIDs."""
         # First exclude an SSID
-        exclude_response = client.post("/api/ssids/0/exclude")
-        assert exclude_response.status_code == 200
+        exclusion_manager.exclude_ssid(0)
 
         # Now get available only
         response = client.get("/api/ssids?available_only=true")
@@ -48,11 +190,12 @@ class TestSSIDExclusionEndpoints:
         indices = [s["index"] for s in ssids]
         assert 0 not in indices
 
-    def test_list_ssids_excluded_only_filter(self, client: TestClient):
+    def test_list_ssids_excluded_only_filter(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """GET /api/ssids?excluded_only=true should return only excluded SSIDs."""
         # First exclude an SSID
-        exclude_response = client.post("/api/ssids/0/exclude")
-        assert exclude_response.status_code == 200
+        exclusion_manager.exclude_ssid(0)
 
         # Now get excluded only
         response = client.get("/api/ssids?excluded_only=true")
@@ -64,6 +207,13 @@ class TestSSIDExclusionEndpoints:
         assert ssids[0]["index"] == 0
         assert ssids[0]["excluded"] is True
 
+    def test_list_ssids_active_only_filter(self, client: TestClient):
+        """GET /api/ssids?active_only=true should return only active SSIDs, in order."""
+        response = client.get("/api/ssids?active_only=true")
+        assert response.status_code == 200
+        indices = [s["index"] for s in response.json()]
+        assert indices == [i for i, s in enumerate(SPECIAL_SSIDS) if s.active]
+
     def test_get_ssid_includes_excluded_field(self, client: TestClient):
         """GET /api/ssids/{index} should include excluded field."""
         response = client.get("/api/ssids/0")
@@ -72,79 +222,69 @@ class TestSSIDExclusionEndpoints:
         assert "excluded" in ssid
         assert ssid["excluded"] is False
 
-    def test_exclude_ssid(self, client: TestClient):
+    def test_exclude_ssid(self, client: TestClient, exclusion_manager: ExclusionManager):
         """POST /api/ssids/{index}/exclude should exclude the SSID."""
-        response = client.post("/api/ssids/0/exclude")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "excluded"
-        assert data["index"] == 0
-        assert data["character"] == SPECIAL_SSIDS[0].character_name
+        _post_ok(
+            client,
+            "/api/ssids/0/exclude",
+            action="excluded",
+            index=0,
+            character=SPECIAL_SSIDS[0].character_name,
+        )
+
+        assert exclusion_manager.is_ssid_excluded(0)
 
-        # Verify it's now excluded
-        get_response = client.get("/api/ssids/0")
-        assert get_response.json()["excluded"] is True
+    def test_exclude_ssids_bulk(self, client: TestClient, exclusion_manager: ExclusionManager):
+        """POST /api/ssids/exclude should exclude every listed SSID."""
+        _post_ok(
+            client,
+            "/api/ssids/exclude",
+            json={"indices": [2, 0, 2]},
+            indices=[0, 2],
+            excluded_count=2,
+        )
+        assert exclusion_manager.get_excluded_ssids() == {0, 2}
 
-    def test_exclude_ssid_not_found(self, client: TestClient):
-        """POST /api/ssids/{index}/exclude should return 404 for invalid index."""
-        response = client.post("/api/ssids/9999/exclude")
+    def test_exclude_ssids_bulk_not_found(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
+        """POST /api/ssids/exclude should reject the batch if any index is invalid."""
+        response = client.post("/api/ssids/exclude", json={"indices": [0, 9999]})
         assert response.status_code == 404
+        assert exclusion_manager.get_excluded_ssid_count() == 0
 
-    def test_include_ssid(self, client: TestClient):
+    def test_include_ssid(self, client: TestClient, exclusion_manager: ExclusionManager):
         """POST /api/ssids/{index}/include should include a previously excluded SSID."""
         # First exclude
-        client.post("/api/ssids/0/exclude")
+        exclusion_manager.exclude_ssid(0)
 
         # Then include
-        response = client.post("/api/ssids/0/include")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "included"
-        assert data["index"] == 0
+        _post_ok(client, "/api/ssids/0/include", action="included", index=0)
 
-        # Verify it's now included
-        get_response = client.get("/api/ssids/0")
-        assert get_response.json()["excluded"] is False
+        assert not exclusion_manager.is_ssid_excluded(0)
 
-    def test_include_ssid_not_found(self, client: TestClient):
-        """POST /api/ssids/{index}/include should return 404 for invalid index."""
-        response = client.post("/api/ssids/9999/include")
-        assert response.status_code == 404
-
-    def test_toggle_ssid_exclusion_excludes(self, client: TestClient):
+    def test_toggle_ssid_exclusion_excludes(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """POST /api/ssids/{index}/toggle-exclusion should toggle to excluded."""
-        response = client.post("/api/ssids/0/toggle-exclusion")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "excluded"
-        assert data["excluded"] is True
+        _post_ok(client, "/api/ssids/0/toggle-exclusion", action="excluded", excluded=True)
+        assert exclusion_manager.is_ssid_excluded(0)
 
-    def test_toggle_ssid_exclusion_includes(self, client: TestClient):
+    def test_toggle_ssid_exclusion_includes(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """POST /api/ssids/{index}/toggle-exclusion should toggle to included."""
         # First exclude
-        client.post("/api/ssids/0/exclude")
+        exclusion_manager.exclude_ssid(0)
 
         # Then toggle (should include)
-        response = client.post("/api/ssids/0/toggle-exclusion")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "included"
-        assert data["excluded"] is False
-
-    def test_toggle_ssid_exclusion_not_found(self, client: TestClient):
-        """POST /api/ssids/{index}/toggle-exclusion should return 404 for invalid index."""
-        response = client.post("/api/ssids/9999/toggle-exclusion")
-        assert response.status_code == 404
+        _post_ok(client, "/api/ssids/0/toggle-exclusion", action="included", excluded=False)
+        assert not exclusion_manager.is_ssid_excluded(0)
 
-    def test_get_ssid_exclusions(self, client: TestClient):
+    def test_get_ssid_exclusions(self, client: TestClient, exclusion_manager: ExclusionManager):
         """GET /api/ssid-exclusions should return exclusion summary."""
         # Exclude a couple of SSIDs
-        client.post("/api/ssids/0/exclude")
-        client.post("/api/ssids/1/exclude")
+        exclusion_manager.exclude_ssids([0, 1])
 
         response = client.get("/api/ssid-exclusions")
         assert response.status_code == 200
@@ -152,13 +292,12 @@ class TestSSIDExclusionEndpoints:
         assert data["excluded_count"] == 2
         assert 0 in data["excluded_indices"]
         assert 1 in data["excluded_indices"]
-        assert data["total_ssids"] == len(SPECIAL_SSIDS)
+        assert data["total_ssids"] == _N_SSIDS
 
-    def test_clear_ssid_exclusions(self, client: TestClient):
+    def test_clear_ssid_exclusions(self, client: TestClient, exclusion_manager: ExclusionManager):
         """DELETE /api/ssid-exclusions should clear all SSID exclusions."""
         # Exclude some SSIDs
-        client.post("/api/ssids/0/exclude")
-        client.post("/api/ssids/1/exclude")
+        exclusion_manager.exclude_ssids([0, 1])
 
         # Clear all
         response = client.delete("/api/ssid-exclusions")
@@ -169,11 +308,11 @@ class TestSSIDExclusionEndpoints:
         exclusions = client.get("/api/ssid-exclusions").json()
         assert exclusions["excluded_count"] == 0
 
-    def test_clear_all_exclusions(self, client: TestClient):
+    def test_clear_all_exclusions(self, client: TestClient, exclusion_manager: ExclusionManager):
         """DELETE /api/all-exclusions should clear both character and SSID exclusions."""
         # Exclude a character and an SSID
-        client.post("/api/characters/0/exclude")
-        client.post("/api/ssids/0/exclude")
+        exclusion_manager.exclude(0)
+        exclusion_manager.exclude_ssid(0)
 
         # Clear all
         response = client.delete("/api/all-exclusions")
@@ -181,47 +320,49 @@ class TestSSIDExclusionEndpoints:
         assert response.json()["status"] == "ok"
 
         # Verify none are excluded
-        ssid_exclusions = client.get("/api/ssid-exclusions").json()
-        assert ssid_exclusions["excluded_count"] == 0
+        summary = client.get("/api/exclusions/summary").json()
+        assert summary["characters"]["excluded_count"] == 0
+        assert summary["ssids"]["excluded_count"] == 0
+
+    def test_exclusions_summary(self, client: TestClient, exclusion_manager: ExclusionManager):
+        """GET /api/exclusions/summary should report both exclusion types."""
+        exclusion_manager.exclude(0)
+        exclusion_manager.exclude_ssid(0)
 
-        char_exclusions = client.get("/api/exclusions").json()
-        assert char_exclusions["excluded_count"] == 0
+        response = client.get("/api/exclusions/summary")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["characters"] == client.get("/api/exclusions").json()
+        assert data["ssids"] == client.get("/api/ssid-exclusions").json()
+        assert data["characters"]["excluded_indices"] == [0]
+        assert data["ssids"]["excluded_indices"] == [0]
 
 
 class TestStatusEndpoint:
     """Tests for the status API endpoint."""
 
-    def test_get_status(self, client: TestClient):
+    def test_get_status(self, status_info: dict):
         """GET /api/status should return current status."""
-        response = client.get("/api/status")
-        assert response.status_code == 200
-        data = response.json()
-        assert "ssid" in data
-        assert "mac_mode" in data
-        assert "ssid_mode" in data
-        assert "total_characters" in data
-        assert "available_characters" in data
-        assert "excluded_characters" in data
-        assert "total_special_ssids" in data
+        StatusResponse.model_validate(status_info)
 
-    def test_status_shows_character_counts(self, client: TestClient):
+    def test_status_shows_character_counts(self, status_info: dict):
         """Status should show correct character counts."""
-        response = client.get("/api/status")
-        data = response.json()
-        assert data["total_characters"] == len(CHARACTERS)
-        assert data["available_characters"] == len(CHARACTERS)
-        assert data["excluded_characters"] == 0
+        assert status_info["total_characters"] == _N_CHARACTERS
+        assert status_info["available_characters"] == _N_CHARACTERS
+        assert status_info["excluded_characters"] == 0
 
 
 class TestCharacterEndpoints:
     """Tests for character API endpoints."""
 
-    def test_list_characters(self, client: TestClient):
+    def test_list_characters(self, characters_list: list[dict]):
         """GET /api/characters should return all characters."""
-        response = client.get("/api/characters")
-        assert response.status_code == 200
-        chars = response.json()
-        assert len(chars) == len(CHARACTERS)
+        assert len(characters_list) == _N_CHARACTERS
+
+    def test_list_characters_in_roster_order(self, characters_list: list[dict]):
+        """GET /api/characters should list the roster in order, indexed from 0."""
+        assert [c["index"] for c in characters_list] == list(range(_N_CHARACTERS))
+        assert [c["name"] for c in characters_list] == [c.name for c in CHARACTERS]
 
     def test_list_characters_with_search(self, client: TestClient):
         """GET /api/characters?search=mametchi should filter by name."""
@@ -232,10 +373,12 @@ class TestCharacterEndpoints:
         for char in chars:
             assert "mametchi" in char["name"].lower()
 
-    def test_list_characters_excluded_only(self, client: TestClient):
+    def test_list_characters_excluded_only(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """GET /api/characters?excluded_only=true should return only excluded."""
         # First exclude a character
-        client.post("/api/characters/0/exclude")
+        exclusion_manager.exclude(0)
 
         response = client.get("/api/characters?excluded_only=true")
         assert response.status_code == 200
@@ -244,10 +387,12 @@ class TestCharacterEndpoints:
         assert chars[0]["index"] == 0
         assert chars[0]["excluded"] is True
 
-    def test_list_characters_available_only(self, client: TestClient):
+    def test_list_characters_available_only(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """GET /api/characters?available_only=true should exclude excluded chars."""
         # First exclude a character
-        client.post("/api/characters/0/exclude")
+        exclusion_manager.exclude(0)
 
         response = client.get("/api/characters?available_only=true")
         assert response.status_code == 200
@@ -259,152 +404,133 @@ class TestCharacterEndpoints:
         """GET /api/characters/{index} should return specific character."""
         response = client.get("/api/characters/0")
         assert response.status_code == 200
-        char = response.json()
-        assert char["index"] == 0
-        assert char["name"] == CHARACTERS[0].name
-        assert "mac_address" in char
-        assert "excluded" in char
-
-    def test_get_character_not_found(self, client: TestClient):
-        """GET /api/characters/{index} should return 404 for invalid index."""
-        response = client.get("/api/characters/9999")
-        assert response.status_code == 404
+        char = CharacterResponse.model_validate(response.json())
+        assert char.index == 0
+        assert char.name == CHARACTERS[0].name
 
-    def test_exclude_character(self, client: TestClient):
+    def test_exclude_character(self, client: TestClient, exclusion_manager: ExclusionManager):
         """POST /api/characters/{index}/exclude should exclude character."""
-        response = client.post("/api/characters/0/exclude")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "excluded"
+        _post_ok(client, "/api/characters/0/exclude", action="excluded")
+        assert exclusion_manager.is_excluded(0)
 
-    def test_exclude_character_not_found(self, client: TestClient):
-        """POST /api/characters/{index}/exclude should return 404 for invalid."""
-        response = client.post("/api/characters/9999/exclude")
-        assert response.status_code == 404
-
-    def test_include_character(self, client: TestClient):
+    def test_include_character(self, client: TestClient, exclusion_manager: ExclusionManager):
         """POST /api/characters/{index}/include should include character."""
-        client.post("/api/characters/0/exclude")
-        response = client.post("/api/characters/0/include")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["action"] == "included"
+        exclusion_manager.exclude(0)
+        _post_ok(client, "/api/characters/0/include", action="included")
+        assert not exclusion_manager.is_excluded(0)
 
-    def test_toggle_character_exclusion(self, client: TestClient):
+    def test_toggle_character_exclusion(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """POST /api/characters/{index}/toggle-exclusion should toggle."""
         # First toggle (exclude)
-        response = client.post("/api/characters/0/toggle-exclusion")
-        assert response.status_code == 200
-        assert response.json()["excluded"] is True
+        assert _post_json(client, "/api/characters/0/toggle-exclusion")["excluded"] is True
+        assert exclusion_manager.is_excluded(0)
 
         # Second toggle (include)
-        response = client.post("/api/characters/0/toggle-exclusion")
-        assert response.status_code == 200
-        assert response.json()["excluded"] is False
+        assert _post_json(client, "/api/characters/0/toggle-exclusion")["excluded"] is False
+        assert not exclusion_manager.is_excluded(0)
 
 
 class TestConfigEndpoint:
     """Tests for the config API endpoint."""
 
-    def test_update_config_mac_mode(self, client: TestClient):
-        """POST /api/config should update mac_mode."""
-        response = client.post("/api/config", json={"mac_mode": "random"})
-        assert response.status_code == 200
-        assert response.json()["status"] == "ok"
-
-    def test_update_config_invalid_mac_mode(self, client: TestClient):
-        """POST /api/config should reject invalid mac_mode."""
-        response = client.post("/api/config", json={"mac_mode": "invalid"})
-        assert response.status_code == 400
-
-    def test_update_config_ssid_mode(self, client: TestClient):
-        """POST /api/config should update ssid_mode."""
-        response = client.post("/api/config", json={"ssid_mode": "special"})
-        assert response.status_code == 200
-
-    def test_update_config_invalid_ssid_mode(self, client: TestClient):
-        """POST /api/config should reject invalid ssid_mode."""
-        response = client.post("/api/config", json={"ssid_mode": "invalid"})
-        assert response.status_code == 400
-
-    def test_update_config_rotation_mode_resets_ssid_mode(self, client: TestClient):
-        """Switching to rotation mode should reset ssid_mode to normal."""
-        # First set ssid_mode to special
-        client.post("/api/config", json={"ssid_mode": "special"})
-
-        # Now switch to daily_random
-        client.post("/api/config", json={"mac_mode": "daily_random"})
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"mac_mode": "random"}, id="mac_mode"),
+            pytest.param({"ssid_mode": "special"}, id="ssid_mode"),
+            pytest.param({"special_ssid_index": 5}, id="special_ssid_index"),
+            pytest.param({"fixed_character_index": 5}, id="fixed_character_index"),
+            pytest.param({"mac_mode": "fixed", "fixed_character_index": 10}, id="multiple"),
+            pytest.param({}, id="empty"),
+        ],
+    )
+    def test_update_config(self, client: TestClient, payload: dict):
+        """POST /api/config should accept valid updates."""
+        _post_ok(client, "/api/config", json=payload)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"mac_mode": "invalid"}, id="mac_mode"),
+            pytest.param({"ssid_mode": "invalid"}, id="ssid_mode"),
+            pytest.param({"special_ssid_index": 9999}, id="special_ssid_index"),
+            pytest.param({"fixed_character_index": 9999}, id="fixed_character_index"),
+        ],
+    )
+    def test_update_config_rejects_invalid(self, client: TestClient, payload: dict):
+        """POST /api/config should reject invalid values."""
+        assert client.post("/api/config", json=payload).status_code == 400
+
+    @pytest.mark.parametrize("mac_mode", ["daily_random", "random", "cycle"])
+    def test_update_config_rotation_mode_resets_ssid_mode(
+        self, client: TestClient, set_config: Callable[..., None], mac_mode: str
+    ):
+        """Switching to a rotation mode should reset ssid_mode to normal."""
+        set_config(ssid_mode=SsidMode.SPECIAL)
+
+        _post_ok(client, "/api/config", json={"mac_mode": mac_mode})
 
         # Check status - ssid_mode should be normal
         status = client.get("/api/status").json()
         assert status["ssid_mode"] == "normal"
 
-    def test_update_config_special_ssid_index(self, client: TestClient):
-        """POST /api/config should update special_ssid_index."""
-        response = client.post("/api/config", json={"special_ssid_index": 5})
-        assert response.status_code == 200
-
-    def test_update_config_invalid_special_ssid_index(self, client: TestClient):
-        """POST /api/config should reject invalid special_ssid_index."""
-        response = client.post("/api/config", json={"special_ssid_index": 9999})
-        assert response.status_code == 400
-
-    def test_update_config_fixed_character_index(self, client: TestClient):
-        """POST /api/config should update fixed_character_index."""
-        response = client.post("/api/config", json={"fixed_character_index": 5})
-        assert response.status_code == 200
-
-    def test_update_config_invalid_fixed_character_index(self, client: TestClient):
-        """POST /api/config should reject invalid fixed_character_index."""
-        response = client.post("/api/config", json={"fixed_character_index": 9999})
-        assert response.status_code == 400
-
 
 class TestSetCharacterEndpoint:
     """Tests for the set character endpoint."""
 
     def test_set_character(self, client: TestClient):
         """POST /api/character/{index} should set the character."""
-        response = client.post("/api/character/5")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
+        data = _post_ok(client, "/api/character/5")
         assert "character" in data
         assert "mac_address" in data
 
-    def test_set_character_invalid_index(self, client: TestClient):
-        """POST /api/character/{index} should return 400 for invalid index."""
-        response = client.post("/api/character/9999")
-        assert response.status_code == 400
-
 
 class TestSetSpecialSSIDEndpoint:
     """Tests for the set special SSID endpoint."""
 
     def test_set_special_ssid(self, client: TestClient):
         """POST /api/ssid/{index} should set the special SSID."""
-        response = client.post("/api/ssid/5")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
+        data = _post_ok(client, "/api/ssid/5")
         assert "ssid" in data
         assert "character" in data
 
-    def test_set_special_ssid_invalid_index(self, client: TestClient):
-        """POST /api/ssid/{index} should return 400 for invalid index."""
-        response = client.post("/api/ssid/9999")
-        assert response.status_code == 400
+
+class TestInvalidIndex:
+    """Tests for out-of-range indices across endpoints."""
+
+    @pytest.mark.parametrize(
+        "index", [pytest.param(9999, id="past_end"), pytest.param(-1, id="negative")]
+    )
+    @pytest.mark.parametrize(
+        ("method", "route", "expected"),
+        [
+            pytest.param("get", "/api/characters/{}", 404, id="get_character"),
+            pytest.param("post", "/api/characters/{}/exclude", 404, id="exclude_character"),
+            pytest.param("post", "/api/characters/{}/include", 404, id="include_character"),
+            pytest.param("post", "/api/characters/{}/toggle-exclusion", 404, id="toggle_character"),
+            pytest.param("get", "/api/ssids/{}", 404, id="get_ssid"),
+            pytest.param("post", "/api/ssids/{}/exclude", 404, id="exclude_ssid"),
+            pytest.param("post", "/api/ssids/{}/include", 404, id="include_ssid"),
+            pytest.param("post", "/api/ssids/{}/toggle-exclusion", 404, id="toggle_ssid"),
+            pytest.param("post", "/api/character/{}", 400, id="set_character"),
+            pytest.param("post", "/api/ssid/{}", 400, id="set_ssid"),
+        ],
+    )
+    def test_invalid_index(
+        self, client: TestClient, method: str, route: str, expected: int, index: int
+    ):
+        """Requests for an index outside the roster should be rejected."""
+        assert getattr(client, method)(route.format(index)).status_code == expected
 
 
 class TestExclusionsEndpoint:
     """Tests for the exclusions endpoint."""
 
-    def test_get_exclusions(self, client: TestClient):
+    def test_get_exclusions(self, client: TestClient, exclusion_manager: ExclusionManager):
         """GET /api/exclusions should return exclusion summary."""
-        client.post("/api/characters/0/exclude")
-        client.post("/api/characters/1/exclude")
+        exclusion_manager.set_excluded({0, 1})
 
         response = client.get("/api/exclusions")
         assert response.status_code == 200
@@ -413,10 +539,9 @@ class TestExclusionsEndpoint:
         assert 0 in data["excluded_indices"]
         assert 1 in data["excluded_indices"]
 
-    def test_clear_exclusions(self, client: TestClient):
+    def test_clear_exclusions(self, client: TestClient, exclusion_manager: ExclusionManager):
         """DELETE /api/exclusions should clear all character exclusions."""
-        client.post("/api/characters/0/exclude")
-        client.post("/api/characters/1/exclude")
+        exclusion_manager.set_excluded({0, 1})
 
         response = client.delete("/api/exclusions")
         assert response.status_code == 200
@@ -435,27 +560,36 @@ class TestHealthEndpoint:
         assert response.status_code in (200, 307)
 
 
+class TestOpenAPISchema:
+    """Tests for the generated OpenAPI schema."""
+
+    def test_schema_served(self, client: TestClient, web_app: FastAPI):
+        """GET /openapi.json should serve the schema cached on the app."""
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert response.json() == web_app.openapi()
+
+    def test_schema_lists_api_routes(self, web_app: FastAPI):
+        """The schema should document the API routes."""
+        paths = web_app.openapi()["paths"]
+        assert "/api/status" in paths
+        assert "/api/exclusions/summary" in paths
+        assert "post" in paths["/api/ssids/exclude"]
+
+
 class TestDebugEndpoint:
     """Tests for the debug API endpoint."""
 
-    def test_get_debug_info(self, client: TestClient):
+    def test_get_debug_info(self, debug_info: dict):
         """GET /api/debug should return debug information."""
-        response = client.get("/api/debug")
-        assert response.status_code == 200
-        data = response.json()
-
         # Check structure - debug info has these top-level keys
-        assert "config" in data or "timestamp" in data
+        assert "config" in debug_info or "timestamp" in debug_info
 
-    def test_debug_config_section(self, client: TestClient):
+    def test_debug_config_section(self, debug_info: dict):
         """Debug info should include config details."""
-        response = client.get("/api/debug")
-        data = response.json()
-
         # The debug response should have config info
-        assert "config" in data
-        config = data["config"]
-        assert isinstance(config, dict)
+        assert "config" in debug_info
+        assert isinstance(debug_info["config"], dict)
 
 
 class TestHealthEndpointExtended:
@@ -510,22 +644,6 @@ class TestHotspotStatusEndpoint:
 class TestConfigEndpointExtended:
     """Extended tests for config endpoint edge cases."""
 
-    def test_update_multiple_fields(self, client: TestClient):
-        """POST /api/config should update multiple fields at once."""
-        response = client.post(
-            "/api/config",
-            json={
-                "mac_mode": "fixed",
-                "fixed_character_index": 10,
-            },
-        )
-        assert response.status_code == 200
-
-    def test_update_empty_request(self, client: TestClient):
-        """POST /api/config with empty body should succeed."""
-        response = client.post("/api/config", json={})
-        assert response.status_code == 200
-
     def test_update_config_invalid_json(self, client: TestClient):
         """POST /api/config with invalid JSON should fail gracefully."""
         response = client.post(
@@ -539,23 +657,21 @@ class TestConfigEndpointExtended:
 class TestCharacterEndpointsExtended:
     """Extended tests for character endpoints."""
 
-    def test_list_characters_with_all_filters(self, client: TestClient):
+    def test_list_characters_with_all_filters(
+        self, client: TestClient, exclusion_manager: ExclusionManager
+    ):
         """GET /api/characters with combined filters."""
         # First exclude a character
-        client.post("/api/characters/0/exclude")
+        exclusion_manager.exclude(0)
 
         # Now search with filters
         response = client.get("/api/characters?search=mame&available_only=true")
         assert response.status_code == 200
 
-    def test_get_character_with_season(self, client: TestClient):
+    def test_get_character_with_season(self, client: TestClient, characters_list: list[dict]):
         """GET /api/characters/{index} should show season if applicable."""
-        # Find a seasonal character (if any)
-        response = client.get("/api/characters")
-        chars = response.json()
-
         # Look for any character with a season
-        seasonal = [c for c in chars if c.get("season")]
+        seasonal = [c for c in characters_list if c.get("season")]
         if seasonal:
             char = seasonal[0]
             response = client.get(f"/api/characters/{char['index']}")
@@ -595,31 +711,49 @@ class TestExclusionIntegration:
         updated = client.get("/api/status").json()
         assert updated["excluded_characters"] == initial_excluded + 1
 
+    @pytest.mark.usefixtures("with_excluded_state")
     def test_clear_all_exclusions_clears_both(self, client: TestClient):
         """DELETE /api/all-exclusions should clear both types."""
-        # Exclude both types
-        client.post("/api/characters/0/exclude")
-        client.post("/api/ssids/0/exclude")
-
-        # Clear all
         response = client.delete("/api/all-exclusions")
         assert response.status_code == 200
 
         # Verify both cleared
-        char_excl = client.get("/api/exclusions").json()
-        ssid_excl = client.get("/api/ssid-exclusions").json()
+        summary = client.get("/api/exclusions/summary").json()
+        assert summary["characters"]["excluded_count"] == 0
+        assert summary["ssids"]["excluded_count"] == 0
 
-        assert char_excl["excluded_count"] == 0
-        assert ssid_excl["excluded_count"] == 0
+
+class TestConcurrentRequests:
+    """Tests for requests issued concurrently."""
+
+    async def test_concurrent_exclusions_all_apply(
+        self, async_client: httpx.AsyncClient, exclusion_manager: ExclusionManager
+    ):
+        """SSID exclusions sent at once should all be recorded."""
+        responses = await asyncio.gather(
+            *(async_client.post(f"/api/ssids/{i}/exclude") for i in range(5))
+        )
+        assert [r.status_code for r in responses] == [200] * 5
+        assert exclusion_manager.get_excluded_ssids() == set(range(5))
+
+    @pytest.mark.usefixtures("with_excluded_state")
+    async def test_concurrent_reads_match_summary(self, async_client: httpx.AsyncClient):
+        """Exclusion reads fanned out together should agree with the summary."""
+        characters, ssids, summary = await asyncio.gather(
+            async_client.get("/api/exclusions"),
+            async_client.get("/api/ssid-exclusions"),
+            async_client.get("/api/exclusions/summary"),
+        )
+        assert summary.json() == {"characters": characters.json(), "ssids": ssids.json()}
 
 
 class TestStatusSpecialModes:
     """Tests for status endpoint in different modes."""
 
-    def test_status_special_ssid_mode(self, client: TestClient):
+    def test_status_special_ssid_mode(self, client: TestClient, set_config: Callable[..., None]):
         """Status should reflect special SSID mode."""
         # Set to special SSID mode
-        client.post("/api/config", json={"ssid_mode": "special", "special_ssid_index": 0})
+        set_config(ssid_mode=SsidMode.SPECIAL, special_ssid_index=0)
 
         response = client.get("/api/status")
         assert response.status_code == 200
@@ -628,9 +762,9 @@ class TestStatusSpecialModes:
         # After setting special, check the status reflects it
         assert data["ssid_mode"] == "special"
 
-    def test_status_cycle_mode(self, client: TestClient):
+    def test_status_cycle_mode(self, client: TestClient, set_config: Callable[..., None]):
         """Status should work in cycle mode."""
-        client.post("/api/config", json={"mac_mode": "cycle"})
+        set_config(mac_mode=MacMode.CYCLE)
 
         response = client.get("/api/status")
         assert response.status_code == 200
@@ -641,10 +775,10 @@ class TestStatusSpecialModes:
 class TestUpcomingCycleMode:
     """Tests for upcoming endpoint in cycle mode."""
 
-    def test_upcoming_in_cycle_mode(self, client: TestClient):
+    def test_upcoming_in_cycle_mode(self, client: TestClient, set_config: Callable[..., None]):
         """GET /api/upcoming should return characters in cycle mode."""
         # Set to cycle mode
-        client.post("/api/config", json={"mac_mode": "cycle"})
+        set_config(mac_mode=MacMode.CYCLE)
 
         response = client.get("/api/upcoming")
         assert response.status_code == 200
@@ -652,15 +786,27 @@ class TestUpcomingCycleMode:
         # Should have upcoming characters
         assert isinstance(data, list)
 
-    def test_upcoming_count_in_cycle_mode(self, client: TestClient):
+    def test_upcoming_count_in_cycle_mode(
+        self, client: TestClient, set_config: Callable[..., None]
+    ):
         """GET /api/upcoming?count=3 should return limited list."""
-        client.post("/api/config", json={"mac_mode": "cycle"})
+        set_config(mac_mode=MacMode.CYCLE)
 
         response = client.get("/api/upcoming?count=3")
         assert response.status_code == 200
         data = response.json()
         assert len(data) <= 3
 
+    def test_upcoming_negative_count_in_cycle_mode(
+        self, client: TestClient, set_config: Callable[..., None]
+    ):
+        """GET /api/upcoming?count=-100 should return an empty list."""
+        set_config(mac_mode=MacMode.CYCLE)
+
+        response = client.get("/api/upcoming?count=-100")
+        assert response.status_code == 200
+        assert response.json() == []
+
 
 class TestCharacterIncludeErrors:
     """Tests for include endpoint error handling."""
@@ -668,52 +814,39 @@ class TestCharacterIncludeErrors:
     def test_include_character_already_included(self, client: TestClient):
         """POST /api/characters/{index}/include on non-excluded should work."""
         # Include a character that's not excluded
-        response = client.post("/api/characters/0/include")
-        assert response.status_code == 200
-        assert response.json()["status"] == "ok"
+        _post_ok(client, "/api/characters/0/include")
 
     def test_include_ssid_already_included(self, client: TestClient):
         """POST /api/ssids/{index}/include on non-excluded should work."""
-        response = client.post("/api/ssids/0/include")
-        assert response.status_code == 200
-        assert response.json()["status"] == "ok"
+        _post_ok(client, "/api/ssids/0/include")
 
 
 class TestDebugEndpointComplete:
     """Comprehensive tests for debug endpoint."""
 
-    def test_debug_info_all_fields(self, client: TestClient):
+    def test_debug_info_all_fields(self, debug_info: dict):
         """GET /api/debug should return complete debug info."""
-        response = client.get("/api/debug")
-        assert response.status_code == 200
-        data = response.json()
-
-        # Check all expected sections exist
-        assert "config" in data
-        assert "selection" in data
-        assert "exclusions" in data
-        assert "system" in data
-        assert "processes" in data
-        assert "network" in data
-        assert "services" in data
-
-    def test_debug_selection_info(self, client: TestClient):
+        assert debug_info.keys() >= {
+            "config",
+            "selection",
+            "exclusions",
+            "system",
+            "processes",
+            "network",
+            "services",
+        }
+
+    def test_debug_selection_info(self, debug_info: dict):
         """Debug selection info should be populated."""
-        response = client.get("/api/debug")
-        data = response.json()
-
-        selection = data["selection"]
+        selection = debug_info["selection"]
         # Should have character info
         assert isinstance(selection, dict)
         assert "character_name" in selection
         assert "is_special_ssid" in selection
 
-    def test_debug_exclusions_info(self, client: TestClient):
+    def test_debug_exclusions_info(self, debug_info: dict):
         """Debug exclusions info should have counts."""
-        response = client.get("/api/debug")
-        data = response.json()
-
-        exclusions = data["exclusions"]
+        exclusions = debug_info["exclusions"]
         assert "excluded_character_count" in exclusions
         assert "excluded_ssid_count" in exclusions
 
@@ -745,8 +878,6 @@ class TestHotspotControlWithMocks:
 
     def test_start_hotspot_as_root(self, client: TestClient):
         """POST /api/hotspot/start should work as root."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = False
         mock_manager.start.return_value = MagicMock(
@@ -759,16 +890,10 @@ class TestHotspotControlWithMocks:
             patch("hotspotchi.web.routes._is_root", return_value=True),
             patch("hotspotchi.web.routes._get_hotspot_manager", return_value=mock_manager),
         ):
-            response = client.post("/api/hotspot/start")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "ok"
-            assert data["ssid"] == "TestSSID"
+            _post_ok(client, "/api/hotspot/start", ssid="TestSSID")
 
     def test_start_hotspot_already_running(self, client: TestClient):
         """POST /api/hotspot/start when already running should return ok."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = True
 
@@ -782,8 +907,6 @@ class TestHotspotControlWithMocks:
 
     def test_start_hotspot_error(self, client: TestClient):
         """POST /api/hotspot/start with error should return 500."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = False
         mock_manager.start.side_effect = RuntimeError("Failed to start")
@@ -798,8 +921,6 @@ class TestHotspotControlWithMocks:
 
     def test_stop_hotspot_as_root(self, client: TestClient):
         """POST /api/hotspot/stop should work as root."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = True
 
@@ -813,8 +934,6 @@ class TestHotspotControlWithMocks:
 
     def test_stop_hotspot_not_running(self, client: TestClient):
         """POST /api/hotspot/stop when not running should return ok."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = False
 
@@ -828,8 +947,6 @@ class TestHotspotControlWithMocks:
 
     def test_restart_via_systemd(self, client: TestClient):
         """POST /api/hotspot/restart should try systemd first."""
-        from unittest.mock import patch
-
         with (
             patch("hotspotchi.web.routes._is_root", return_value=True),
             patch("hotspotchi.web.routes._restart_via_systemd", return_value=True),
@@ -840,8 +957,6 @@ class TestHotspotControlWithMocks:
 
     def test_restart_direct_fallback(self, client: TestClient):
         """POST /api/hotspot/restart should fall back to direct restart."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.restart.return_value = MagicMock(
             ssid="TestSSID",
@@ -860,8 +975,6 @@ class TestHotspotControlWithMocks:
 
     def test_restart_error(self, client: TestClient):
         """POST /api/hotspot/restart with error should return 500."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.restart.side_effect = RuntimeError("Failed to restart")
 
@@ -879,20 +992,14 @@ class TestCharacterSelectionWithApply:
 
     def test_set_character_with_apply_systemd(self, client: TestClient):
         """POST /api/character/{index}?apply=true should restart via systemd."""
-        from unittest.mock import patch
-
         with (
             patch("hotspotchi.web.routes._is_root", return_value=True),
             patch("hotspotchi.web.routes._restart_via_systemd", return_value=True),
         ):
-            response = client.post("/api/character/0?apply=true")
-            assert response.status_code == 200
-            assert response.json()["applied"] is True
+            assert _post_json(client, "/api/character/0?apply=true")["applied"] is True
 
     def test_set_character_with_apply_direct(self, client: TestClient):
         """POST /api/character/{index}?apply=true should restart directly if systemd fails."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = True
 
@@ -901,27 +1008,19 @@ class TestCharacterSelectionWithApply:
             patch("hotspotchi.web.routes._restart_via_systemd", return_value=False),
             patch("hotspotchi.web.routes._get_hotspot_manager", return_value=mock_manager),
         ):
-            response = client.post("/api/character/0?apply=true")
-            assert response.status_code == 200
-            assert response.json()["applied"] is True
+            assert _post_json(client, "/api/character/0?apply=true")["applied"] is True
             mock_manager.restart.assert_called_once()
 
     def test_set_ssid_with_apply_systemd(self, client: TestClient):
         """POST /api/ssid/{index}?apply=true should restart via systemd."""
-        from unittest.mock import patch
-
         with (
             patch("hotspotchi.web.routes._is_root", return_value=True),
             patch("hotspotchi.web.routes._restart_via_systemd", return_value=True),
         ):
-            response = client.post("/api/ssid/0?apply=true")
-            assert response.status_code == 200
-            assert response.json()["applied"] is True
+            assert _post_json(client, "/api/ssid/0?apply=true")["applied"] is True
 
     def test_set_ssid_with_apply_direct(self, client: TestClient):
         """POST /api/ssid/{index}?apply=true should restart directly if systemd fails."""
-        from unittest.mock import MagicMock, patch
-
         mock_manager = MagicMock()
         mock_manager.is_running.return_value = True
 
@@ -930,9 +1029,32 @@ class TestCharacterSelectionWithApply:
             patch("hotspotchi.web.routes._restart_via_systemd", return_value=False),
             patch("hotspotchi.web.routes._get_hotspot_manager", return_value=mock_manager),
         ):
-            response = client.post("/api/ssid/0?apply=true")
-            assert response.status_code == 200
-            assert response.json()["applied"] is True
+            assert _post_json(client, "/api/ssid/0?apply=true")["applied"] is True
+
+
+class TestRunCmd:
+    """Tests for the debug command runner."""
+
+    @pytest.mark.parametrize(
+        ("stdout", "stderr", "expected"),
+        [
+            pytest.param("out\n", "", "out", id="stdout"),
+            pytest.param("", "err\n", "err", id="stderr_fallback"),
+        ],
+    )
+    def test_returns_output(self, stdout: str, stderr: str, expected: str):
+        """_run_cmd should return stripped stdout, falling back to stderr."""
+        from hotspotchi.web.routes import _run_cmd
+
+        with patch("subprocess.run", return_value=MagicMock(stdout=stdout, stderr=stderr)):
+            assert _run_cmd(["pgrep", "hostapd"]) == expected
+
+    def test_reports_errors(self):
+        """_run_cmd should describe a failure instead of raising."""
+        from hotspotchi.web.routes import _run_cmd
+
+        with patch("subprocess.run", side_effect=FileNotFoundError("pgrep")):
+            assert _run_cmd(["pgrep", "hostapd"]) == "Error: pgrep"
 
 
 class TestSystemdRestart:
@@ -940,8 +1062,6 @@ class TestSystemdRestart:
 
     def test_restart_via_systemd_not_active(self):
         """_restart_via_systemd should return False if service not active."""
-        from unittest.mock import MagicMock, patch
-
         mock_result = MagicMock()
         mock_result.returncode = 1  # Not active
 
@@ -953,8 +1073,6 @@ class TestSystemdRestart:
 
     def test_restart_via_systemd_active(self):
         """_restart_via_systemd should restart and return True if active."""
-        from unittest.mock import MagicMock, patch
-
         mock_is_active = MagicMock()
         mock_is_active.returncode = 0  # Active
 
@@ -982,7 +1100,6 @@ class TestSaveConfig:
         """_save_current_config should create config file if not exists."""
         import tempfile
         from pathlib import Path
-        from unittest.mock import patch
 
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
@@ -1001,7 +1118,6 @@ class TestSaveConfig:
         """_save_current_config should preserve existing settings."""
         import tempfile
         from pathlib import Path
-        from unittest.mock import patch
 
         import yaml
 